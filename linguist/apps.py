@@ -8,3 +8,7 @@ class LinguistConfig(AppConfig):
 
     def ready(self):
         super(LinguistConfig, self).ready()
+
+        from . import utils
+
+        utils.build_language_tables()
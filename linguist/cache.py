@@ -1,81 +1,85 @@
 # -*- coding: utf-8 -*-
-from django.utils.encoding import python_2_unicode_compatible
-from django.utils.functional import cached_property
-
-
-def _get_translation_field_names():
-    """
-    Returns Translation base model field names (excepted "id" field).
-    """
-    from .models import Translation
+import functools
+import operator
+import threading
 
-    fields = Translation._meta.get_all_field_names()
-    fields.remove('id')
+from contextlib import contextmanager
 
-    return fields
+from django.utils.encoding import python_2_unicode_compatible
 
-try:
-    from django.utils.lru_cache import lru_cache
+from . import settings
 
-    get_translation_field_names = lru_cache()(_get_translation_field_names)
-except ImportError:
-    from django.utils.functional import memoize
 
-    get_translation_field_names = memoize(_get_translation_field_names, {}, 0)
+_local = threading.local()
 
 
 @python_2_unicode_compatible
 class CachedTranslation(object):
+    """
+    A translation cached in a model instance.
+    """
 
-    def __init__(self, **kwargs):
-        self.fields = get_translation_field_names()
-
-        attrs = self.fields + ['instance', 'translation']
-
-        for attr in attrs:
-            setattr(self, attr, None)
+    __slots__ = (
+        'identifier',
+        'object_id',
+        'language',
+        'field_name',
+        'field_value',
+        'instance',
+        'translation',
+        'is_new',
+        'has_changed',
+    )
 
-        self.__dict__.update(**kwargs)
+    fields = ('identifier', 'object_id', 'language', 'field_name', 'field_value')
 
-        self.is_new = True
+    def __init__(self, identifier=None, object_id=None, language=None, field_name=None,
+                 field_value=None, instance=None, translation=None, is_new=True):
+        self.identifier = identifier
+        self.object_id = object_id
+        self.language = language
+        self.field_name = field_name
+        self.field_value = field_value
+        self.instance = instance
+        self.translation = translation
+        self.is_new = is_new
         self.has_changed = False
 
-        if self.instance is not None:
-            self.identifier = self.instance.linguist_identifier
-            self.object_id = self.instance.pk
+        if instance is not None:
+            self.identifier = instance.linguist_identifier
+            self.object_id = instance.pk
 
-        if self.translation is not None:
-            self.is_new = bool(self.translation.pk is None)
-            for attr in ('language', 'field_name', 'field_value'):
-                setattr(self, attr, getattr(self.translation, attr))
+        if translation is not None:
+            self.is_new = bool(translation.pk is None)
+            self.language = translation.language
+            self.field_name = translation.field_name
+            self.field_value = translation.field_value
 
-    @cached_property
+    @property
     def attrs(self):
         """
         Returns Translation attributes to pass as kwargs for creating or updating objects.
         """
         return dict((k, getattr(self, k)) for k in self.fields)
 
-    @cached_property
+    @property
     def lookup(self):
         """
         Returns lookup for get() and filter() methods.
         """
-        lookup = dict((k, getattr(self, k)) for k in self.fields)
-        lookup.pop('field_value')
-        return lookup
+        return {
+            'identifier': self.identifier,
+            'object_id': self.object_id,
+            'language': self.language,
+            'field_name': self.field_name,
+        }
 
     @classmethod
     def from_object(cls, obj):
         """
         Updates values from the given object.
         """
-        instance = cls(**dict((field, getattr(obj, field))
-                              for field in get_translation_field_names()))
-
-        instance.is_new = False
-
-        return instance
+        return cls(obj.identifier, obj.object_id, obj.language, obj.field_name, obj.field_value, is_new=False)
 
     def __str__(self):
         return '%s:%s:%s:%s' % (
@@ -83,3 +87,360 @@ class CachedTranslation(object):
             self.object_id,
             self.field_name,
             self.language)
+
+
+class TranslationIndex(object):
+    """
+    Positions of a linguist model translations (one per field and supported
+    language) in the translation store of its instances. Computed once per
+    model class.
+    """
+
+    __slots__ = ('fields', 'languages', 'positions', 'size', 'mask', 'field_masks', 'language_masks')
+
+    def __init__(self, fields, languages):
+        self.fields = tuple(fields)
+        self.languages = tuple(languages)
+        self.size = len(self.fields) * len(self.languages)
+        self.mask = (1 << self.size) - 1
+        self.positions = {}
+        self.field_masks = {}
+        self.language_masks = {}
+
+        for i, field_name in enumerate(self.fields):
+            for j, language in enumerate(self.languages):
+                position = i * len(self.languages) + j
+                self.positions[(field_name, language)] = position
+                # Supported languages are also referred to with underscores ("pt_br")
+                self.positions.setdefault((field_name, language.replace('-', '_')), position)
+                self.field_masks[field_name] = self.field_masks.get(field_name, 0) | 1 << position
+                for code in (language, language.replace('-', '_')):
+                    self.language_masks[code] = self.language_masks.get(code, 0) | 1 << position
+
+    def get_mask(self, languages=None, field_names=None):
+        """
+        Returns the bitmask of the positions of the given languages and
+        fields (all of them if None).
+        """
+        mask = self.mask
+        if languages is not None:
+            mask &= functools.reduce(operator.or_, (self.language_masks.get(l, 0) for l in languages), 0)
+        if field_names is not None:
+            mask &= functools.reduce(operator.or_, (self.field_masks.get(f, 0) for f in field_names), 0)
+        return mask
+
+
+class TranslationStore(object):
+    """
+    Translations cached in a model instance: a flat list of slots laid out by
+    the model ``TranslationIndex``, with bitmaps of the filled slots and of
+    the slots holding unsaved changes. Translations in languages out of the
+    index are kept aside.
+
+    Once ``known`` (all translations of the instance in these languages
+    loaded, or a single translation looked up in vain, see
+    ``mark_missing()``), empty slots stand for missing translations,
+    materialized only when read.
+    """
+
+    __slots__ = ('index', 'slots', 'extra', 'filled', 'dirty', 'known')
+
+    def __init__(self, index):
+        self.index = index
+        self.clear()
+
+    def clear(self):
+        self.slots = [None] * self.index.size
+        self.extra = {}
+        self.filled = 0
+        self.dirty = 0
+        self.known = 0
+
+    @property
+    def count(self):
+        """
+        Returns the number of materialized translations in slots.
+        """
+        return bin(self.filled).count('1')
+
+    @property
+    def complete(self):
+        """
+        Returns True if all translations of the instance are known.
+        """
+        return self.known == self.index.mask
+
+    def mark_missing(self, languages=None, field_names=None):
+        """
+        Flags translations of the given languages and fields (all of them if
+        None) not loaded in cache as missing.
+        """
+        self.known |= self.index.get_mask(languages, field_names)
+
+    def get(self, field_name, language):
+        """
+        Returns the cached translation of the given field and language or None.
+        """
+        position = self.index.positions.get((field_name, language))
+        if position is None:
+            return self.extra.get((field_name, language))
+        return self.slots[position]
+
+    def is_missing(self, field_name, language):
+        """
+        Returns True if the translation of the given field and language is
+        known not to exist.
+        """
+        position = self.index.positions.get((field_name, language))
+        return bool(position is not None and (self.known >> position) & 1 and self.slots[position] is None)
+
+    def set(self, field_name, language, cached_obj):
+        """
+        Caches a translation for the given field and language.
+        """
+        position = self.index.positions.get((field_name, language))
+        if position is None:
+            self.extra[(field_name, language)] = cached_obj
+            return
+        self.filled |= 1 << position
+        self.slots[position] = cached_obj
+        if cached_obj.has_changed or (cached_obj.is_new and cached_obj.field_value):
+            self.dirty |= 1 << position
+
+    def mark_dirty(self, field_name, language):
+        """
+        Flags the translation of the given field and language as changed.
+        """
+        position = self.index.positions.get((field_name, language))
+        if position is not None:
+            self.dirty |= 1 << position
+
+    def mark_clean(self):
+        """
+        Flags all cached translations as saved.
+        """
+        self.dirty = 0
+
+    def keys(self):
+        """
+        Returns ``(field_name, language)`` pairs of cached translations,
+        known missing ones included.
+        """
+        index = self.index
+        return [(index.fields[position // len(index.languages)],
+                 index.languages[position % len(index.languages)])
+                for position, obj in enumerate(self.slots)
+                if obj is not None or (self.known >> position) & 1] + list(self.extra.keys())
+
+    def items(self):
+        """
+        Returns ``((field_name, language), translation)`` pairs of materialized
+        cached translations.
+        """
+        index = self.index
+        items = [((index.fields[position // len(index.languages)],
+                   index.languages[position % len(index.languages)]), obj)
+                 for position, obj in enumerate(self.slots)
+                 if obj is not None]
+        items.extend(self.extra.items())
+        return items
+
+    def values(self):
+        """
+        Returns materialized cached translations.
+        """
+        return [obj for obj in self.slots if obj is not None] + list(self.extra.values())
+
+    def dirty_values(self):
+        """
+        Returns cached translations which may have unsaved changes.
+        """
+        values = []
+        dirty = self.dirty
+        while dirty:
+            bit = dirty & -dirty
+            values.append(self.slots[bit.bit_length() - 1])
+            dirty ^= bit
+        values.extend(obj for obj in self.extra.values() if obj.has_changed or obj.is_new)
+        return values
+
+    def __len__(self):
+        # Cached translations, known missing ones included
+        return bin(self.known | self.filled).count('1') + len(self.extra)
+
+    def __getitem__(self, field_name):
+        """
+        Returns cached translations of the given field as a ``{language:
+        translation}`` dictionary (read-only).
+        """
+        return dict((language, self.get(name, language) or CachedTranslation(field_name=name, language=language))
+                    for name, language in self.keys()
+                    if name == field_name)
+
+
+def get_shared_cache():
+    """
+    Returns the Django cache used to share translations between processes
+    (``LINGUIST_CACHE`` setting) or None if disabled.
+    """
+    if settings.CACHE is None:
+        return None
+
+    from django.core.cache import caches
+
+    return caches[settings.CACHE]
+
+
+def get_translations_cache_key(decider, identifier, object_id):
+    """
+    Returns the cache key of an object translations.
+    """
+    return 'linguist:%s:%s:%s' % (decider._meta.db_table, identifier, object_id)
+
+
+def get_shared_translations(decider, identifier, object_ids):
+    """
+    Returns a dictionary of translations (decider instances) by object ID,
+    for objects found in the shared cache.
+    """
+    cache = get_shared_cache()
+
+    if cache is None or not object_ids:
+        return {}
+
+    keys = dict((get_translations_cache_key(decider, identifier, object_id), object_id)
+                for object_id in object_ids)
+
+    grouped_translations = {}
+
+    for key, values in cache.get_many(list(keys)).items():
+        object_id = keys[key]
+        grouped_translations[object_id] = [decider(identifier=identifier,
+                                                   object_id=object_id,
+                                                   language=language,
+                                                   field_name=field_name,
+                                                   field_value=field_value)
+                                           for language, field_name, field_value in values]
+
+    return grouped_translations
+
+
+def set_shared_translations(decider, identifier, grouped_translations):
+    """
+    Stores translations (a dictionary of decider instances by object ID) in
+    the shared cache. An empty list means the object has no translation.
+    """
+    cache = get_shared_cache()
+
+    if cache is None or not grouped_translations:
+        return
+
+    cache.set_many(dict((get_translations_cache_key(decider, identifier, object_id),
+                         [(t.language, t.field_name, t.field_value) for t in translations])
+                        for object_id, translations in grouped_translations.items()),
+                   timeout=settings.CACHE_TIMEOUT)
+
+
+def get_identity_map():
+    """
+    Returns the identity map of the current thread (translations by cache
+    key) or None if not activated.
+    """
+    return getattr(_local, 'identity_map', None)
+
+
+def activate_identity_map():
+    """
+    Activates the identity map for the current thread.
+    """
+    if get_identity_map() is None:
+        _local.identity_map = {}
+
+
+def deactivate_identity_map():
+    """
+    Deactivates (and empties) the identity map of the current thread.
+    """
+    _local.identity_map = None
+
+
+@contextmanager
+def identity_map():
+    """
+    Context manager keeping loaded translations in an identity map, so that
+    each object translations are fetched at most once within the block.
+    """
+    if get_identity_map() is not None:
+        yield
+        return
+
+    activate_identity_map()
+    try:
+        yield
+    finally:
+        deactivate_identity_map()
+
+
+def get_identity_map_translations(decider, identifier, object_ids):
+    """
+    Returns a dictionary of translations (decider instances) by object ID,
+    for objects found in the identity map.
+    """
+    translations_map = get_identity_map()
+
+    if translations_map is None:
+        return {}
+
+    grouped_translations = {}
+
+    for object_id in object_ids:
+        key = get_translations_cache_key(decider, identifier, object_id)
+        if key in translations_map:
+            grouped_translations[object_id] = translations_map[key]
+
+    return grouped_translations
+
+
+def set_identity_map_translations(decider, identifier, grouped_translations):
+    """
+    Stores translations (a dictionary of decider instances by object ID) in
+    the identity map.
+    """
+    translations_map = get_identity_map()
+
+    if translations_map is None:
+        return
+
+    for object_id, translations in grouped_translations.items():
+        translations_map[get_translations_cache_key(decider, identifier, object_id)] = translations
+
+
+def is_caching_translations():
+    """
+    Returns True if loaded translations are kept in the identity map or in
+    the shared cache.
+    """
+    return get_identity_map() is not None or get_shared_cache() is not None
+
+
+def invalidate_cached_translations(decider, keys):
+    """
+    Removes translations from the identity map and the shared cache. Takes a
+    list of ``(identifier, object_id)`` tuples.
+    """
+    if not keys:
+        return
+
+    cache_keys = [get_translations_cache_key(decider, identifier, object_id)
+                  for identifier, object_id in keys]
+
+    translations_map = get_identity_map()
+
+    if translations_map is not None:
+        for key in cache_keys:
+            translations_map.pop(key, None)
+
+    cache = get_shared_cache()
+
+    if cache is not None:
+        cache.delete_many(cache_keys)
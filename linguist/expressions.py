@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from django.db import models
+from django.db.models.expressions import Expression, F
+
+
+class TranslationValue(Expression):
+    """
+    Translated value of a linguist field in a given language.
+
+    Compiles to a correlated subquery on the model decider table, resolved
+    through its ``(identifier, object_id, language, field_name)`` index.
+    """
+
+    template = ('(SELECT %(table)s.%(field_value)s FROM %(table)s'
+                ' WHERE %(table)s.%(identifier)s = %%s'
+                ' AND %(table)s.%(object_id)s = %(pk)s'
+                ' AND %(table)s.%(field_name)s = %%s'
+                ' AND %(table)s.%(language)s = %%s)')
+
+    def __init__(self, field_name, language, output_field=None):
+        if output_field is None:
+            output_field = models.TextField()
+        super(TranslationValue, self).__init__(output_field=output_field)
+        self.field_name = field_name
+        self.language = language
+        self.model = None
+        self.pk = F('pk')
+
+    def __repr__(self):
+        return '%s(%s, %s)' % (self.__class__.__name__, self.field_name, self.language)
+
+    def get_source_expressions(self):
+        return [self.pk]
+
+    def set_source_expressions(self, exprs):
+        self.pk, = exprs
+
+    def resolve_expression(self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False):
+        c = super(TranslationValue, self).resolve_expression(query, allow_joins, reuse, summarize, for_save)
+        c.model = query.model
+        return c
+
+    def as_sql(self, compiler, connection):
+        qn = connection.ops.quote_name
+        decider = self.model._linguist.decider
+
+        pk_sql, pk_params = compiler.compile(self.pk)
+
+        sql = self.template % {
+            'table': qn(decider._meta.db_table),
+            'field_value': qn(decider._meta.get_field('field_value').column),
+            'identifier': qn(decider._meta.get_field('identifier').column),
+            'object_id': qn(decider._meta.get_field('object_id').column),
+            'field_name': qn(decider._meta.get_field('field_name').column),
+            'language': qn(decider._meta.get_field('language').column),
+            'pk': pk_sql,
+        }
+
+        params = [self.model._linguist.identifier] + list(pk_params) + [self.field_name, self.language]
+
+        return sql, params
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from collections import defaultdict
-
 from django.db import models
 from django.core.exceptions import ImproperlyConfigured
 from django.utils import six
@@ -10,7 +8,8 @@ from django.utils.functional import cached_property
 
 from . import settings
 from . import utils
-from .cache import CachedTranslation
+from .cache import CachedTranslation, TranslationStore, is_caching_translations
+from .lookups import LookupParser
 from .models import Translation
 
 
@@ -65,7 +64,7 @@ class Linguist(object):
 
         # Current site language (translation.get_language())
         current = utils.get_language()
-        if current in self.supported_languages:
+        if utils.is_supported_language(current):
             return current
 
         # Default language descriptor
@@ -86,10 +85,9 @@ class Linguist(object):
     @property
     def cached_languages(self):
         langs = []
-        for k, v in six.iteritems(self.instance._linguist_translations):
-            for lang in v.keys():
-                if lang not in langs:
-                    langs.append(lang)
+        for field_name, lang in self.instance._linguist_translations.keys():
+            if lang not in langs:
+                langs.append(lang)
         return langs
 
     @property
@@ -98,7 +96,11 @@ class Linguist(object):
 
     @property
     def cached_fields(self):
-        return [k for k, v in six.iteritems(self.instance._linguist_translations) if v]
+        fields = []
+        for field_name, lang in self.instance._linguist_translations.keys():
+            if field_name not in fields:
+                fields.append(field_name)
+        return fields
 
     @property
     def cached_suffixed_fields(self):
@@ -117,25 +119,31 @@ class Linguist(object):
     @property
     def translations(self):
         """
-        Returns translations dictionary.
+        Returns translations store (see ``TranslationStore``).
         """
         return self.instance._linguist_translations
 
     @property
     def translation_instances(self):
         """
-        Returns translation instances.
+        Returns translation instances (missing ones are only included once
+        read).
+        """
+        return self.instance._linguist_translations.values()
+
+    @property
+    def dirty_translation_instances(self):
+        """
+        Returns translation instances which may have unsaved changes.
         """
-        return [instance
-                for k, v in six.iteritems(self.instance._linguist_translations)
-                for instance in v.values()]
+        return self.instance._linguist_translations.dirty_values()
 
     @property
     def translations_count(self):
         """
         Returns translations count.
         """
-        return len(self.translation_instances)
+        return len(self.instance._linguist_translations)
 
     def get_cache(self, instance, translation=None,
                   language=None, field_name=None,
@@ -145,18 +153,40 @@ class Linguist(object):
         """
         is_new = bool(instance.pk is None)
 
-        try:
-            cached_obj = instance._linguist_translations[field_name][language]
+        store = instance._linguist_translations
+        cached_obj = store.get(field_name, language)
+
+        # Known missing translation: materialized on first access.
+        if cached_obj is None and store.is_missing(field_name, language):
+            cached_obj = CachedTranslation(instance=instance, language=language, field_name=field_name)
+            store.set(field_name, language, cached_obj)
+
+        if cached_obj is not None:
             if not cached_obj.field_name:
                 cached_obj.field_name = field_name
             if not cached_obj.language:
                 cached_obj.language = language
             if not cached_obj.identifier:
                 cached_obj.identifier = self.instance.linguist_identifier
-        except KeyError:
-            cached_obj = None
-
+        else:
             if not is_new:
+                if translation is None and self.prefetch_siblings(instance, field_name):
+                    return self.get_cache(instance,
+                                          language=language,
+                                          field_name=field_name,
+                                          field_value=field_value)
+
+                # With cached translations, loading all translations of the
+                # instance costs no more than loading one of them.
+                if translation is None and is_caching_translations():
+                    self.load_translations([instance])
+                    if store.get(field_name, language) is None:
+                        store.mark_missing([language], [field_name])
+                    return self.get_cache(instance,
+                                          language=language,
+                                          field_name=field_name,
+                                          field_value=field_value)
+
                 if translation is None:
                     try:
                         translation = self.decider.objects.get(identifier=self.instance.linguist_identifier,
@@ -164,7 +194,7 @@ class Linguist(object):
                                                                language=language,
                                                                field_name=field_name)
                     except self.decider.DoesNotExist:
-                        pass
+                        store.mark_missing([language], [field_name])
 
             if cached_obj is None:
                 if translation is not None:
@@ -175,17 +205,107 @@ class Linguist(object):
                                                    field_name=field_name,
                                                    field_value=field_value)
 
-            instance._linguist_translations[cached_obj.field_name][cached_obj.language] = cached_obj
+            store.set(cached_obj.field_name, cached_obj.language, cached_obj)
 
         return cached_obj
 
+    def prefetch_siblings(self, instance, field_name=None):
+        """
+        Loads translations of the instances fetched along with the given one
+        (same queryset), in a single query: translations of the given field
+        and of the fields loaded along with it (see
+        ``QuerySetMixin.get_siblings_groups``). Returns False if there is
+        nothing to load.
+        """
+        siblings = getattr(instance, '_linguist_siblings', None)
+
+        if not siblings:
+            return False
+
+        if field_name is None:
+            field_name = self.fields[0]
+
+        group = siblings.get(field_name)
+
+        if not group:
+            return False
+
+        instances = list(group)
+        del group[:]
+
+        field_names = [name for name, other in six.iteritems(siblings) if other is group]
+        if len(field_names) == len(self.fields):
+            field_names = None
+
+        self.load_translations(instances, field_names=field_names)
+
+        return True
+
+    def load_translations(self, instances, field_names=None, languages=None):
+        """
+        Loads all translations (of the given fields and languages) of the
+        given instances in a single query and populates missing ones. Values
+        already cached are kept.
+        """
+        grouped_translations = utils.get_grouped_translations(instances, field_names=field_names, languages=languages)
+        populated_scope = utils.get_populated_scope(field_names=field_names, languages=languages, deferred=True)
+
+        for obj in instances:
+            for translation in grouped_translations.get(obj.pk, []):
+                # Never override values set before loading
+                if obj._linguist.translations.get(translation.field_name, translation.language) is None:
+                    obj._linguist.set_cache(instance=obj, translation=translation)
+            obj.populate_missing_translations(**populated_scope)
+
+    def resolve_fallback(self, instance, field_name, language=None):
+        """
+        Returns the value of the given field in the first language of the
+        fallback chain of the given language (defaults to the active
+        language) having one (see ``utils.get_fallback_languages()``), or
+        an empty string.
+
+        The chain is walked through cached translations: no query if it has
+        been prefetched, otherwise its remaining languages are loaded at
+        once, on the first one not cached.
+        """
+        languages = utils.get_fallback_languages(language or self.active_language, instance.default_language)
+
+        for i, language in enumerate(languages):
+            if self.is_pending(instance, field_name, language):
+                self.load_fallbacks(instance, field_name, languages[i:])
+            value = self.get_cache(instance=instance, language=language, field_name=field_name).field_value
+            if value:
+                return value
+
+        return ''
+
+    def is_pending(self, instance, field_name, language):
+        """
+        Returns True if the translation of the given field and language of a
+        saved instance is neither cached nor known to be missing.
+        """
+        if instance.pk is None:
+            return False
+        store = instance._linguist_translations
+        return store.get(field_name, language) is None and not store.is_missing(field_name, language)
+
+    def load_fallbacks(self, instance, field_name, languages):
+        """
+        Loads translations of the given field in the given fallback languages
+        in a single query, unless translations of the instance are loaded
+        along with its siblings or from cache (see ``get_cache()``).
+        """
+        if self.prefetch_siblings(instance, field_name) or is_caching_translations():
+            return
+        self.load_translations([instance], field_names=[field_name], languages=languages)
+
     def set_cache(self, instance=None, translation=None, language=None, field_name=None, field_value=None):
         """
         Add a new translation into the cache.
         """
         if instance is not None and translation is not None:
             cached_obj = CachedTranslation.from_object(translation)
-            instance._linguist_translations[translation.field_name][translation.language] = cached_obj
+            instance._linguist_translations.set(translation.field_name, translation.language, cached_obj)
             return cached_obj
 
         if instance is None:
@@ -200,6 +320,7 @@ class Linguist(object):
         if field_value != cached_obj.field_value:
             cached_obj.has_changed = True
             cached_obj.field_value = field_value
+            instance._linguist_translations.mark_dirty(cached_obj.field_name, cached_obj.language)
 
         return cached_obj
 
@@ -232,13 +353,26 @@ class CacheDescriptor(object):
     Cache Descriptor.
     """
 
-    def __init__(self, meta):
+    def __init__(self, meta, index, model=None):
+        self.index = index
+        self.model = model
+        self._lookups = None
         self.identifier = meta.get('identifier', None)
         self.fields = meta.get('fields', None)
         self.default_language = meta.get('default_language', settings.DEFAULT_LANGUAGE)
         self.default_language_field = meta.get('default_language_field', None)
         self.decider = meta.get('decider', Translation)
 
+    @property
+    def lookups(self):
+        """
+        Returns the model lookup parser (see ``LookupParser``), built on
+        first use and shared by all querysets of the model.
+        """
+        if self._lookups is None or self._lookups.is_stale():
+            self._lookups = LookupParser(self.model, self.fields)
+        return self._lookups
+
     def __get__(self, instance, instance_type=None):
         if instance is None:
             return self
@@ -254,7 +388,7 @@ class CacheDescriptor(object):
                                 decider=self.decider)
 
             setattr(instance, '_linguist_cache', linguist)
-            setattr(instance, '_linguist_translations', defaultdict(dict))
+            setattr(instance, '_linguist_translations', TranslationStore(self.index))
 
         return instance._linguist_cache
 
@@ -2,6 +2,11 @@
 import collections
 import itertools
 
+import django
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import QuerySet, prefetch_related_objects
+from django.utils import six
+
 from . import utils
 
 
@@ -9,23 +14,111 @@ def prefetch_translations(instances, **kwargs):
     """
     Prefetches translations for the given instances.
     Can be useful for a list of instances.
+
+    Instances of different linguist models are accepted: translations are
+    then fetched with one query per decider.
     """
     from .mixins import ModelMixin
 
     if not isinstance(instances, collections.Iterable):
         instances = [instances]
 
+    if not isinstance(instances, QuerySet):
+        instances = list(instances)
+        if len(set(utils.get_instance_model(instance) for instance in instances)) > 1:
+            return prefetch_translations_by_decider(instances, **kwargs)
+
     populate_missing = kwargs.get('populate_missing', True)
+    populated_scope = utils.get_populated_scope(**kwargs)
     grouped_translations = utils.get_grouped_translations(instances, **kwargs)
 
     # In the case of no translations objects
     if not grouped_translations and populate_missing:
         for instance in instances:
-            instance.populate_missing_translations()
+            instance.populate_missing_translations(**populated_scope)
 
     for instance in instances:
         if issubclass(instance.__class__, ModelMixin) and instance.pk in grouped_translations:
             for translation in grouped_translations[instance.pk]:
                 instance._linguist.set_cache(instance=instance, translation=translation)
             if populate_missing:
-                instance.populate_missing_translations()
+                instance.populate_missing_translations(**populated_scope)
+
+
+def get_related_instances(instances, relation):
+    """
+    Returns instances related to the given ones through the given relation
+    lookup (``'category'``, ``'tags'``, ``'category__parent'``...), for each
+    level of the lookup. Relations not cached yet are fetched the same way
+    ``prefetch_related()`` does, one query per level.
+    """
+    instances = list(instances)
+
+    if not instances:
+        return []
+
+    if django.VERSION < (1, 10):
+        prefetch_related_objects(instances, [relation])
+    else:
+        prefetch_related_objects(instances, relation)
+
+    related = []
+
+    for name in relation.split(LOOKUP_SEP):
+        values = []
+        for instance in instances:
+            value = getattr(instance, name, None)
+            if value is None:
+                continue
+            if hasattr(value, 'all'):
+                values.extend(value.all())
+            else:
+                values.append(value)
+        related.extend(values)
+        instances = values
+
+    return related
+
+
+def prefetch_related_translations(instances, *relations, **kwargs):
+    """
+    Prefetches translations of linguist instances related to the given ones
+    through the given relation lookups, with one query per decider.
+    """
+    related = []
+    for relation in relations:
+        related.extend(get_related_instances(instances, relation))
+
+    prefetch_translations_by_decider(related, **kwargs)
+
+
+def prefetch_translations_by_decider(instances, **kwargs):
+    """
+    Prefetches translations of the given linguist instances, whatever their
+    model: instances are grouped by decider, with one query per decider.
+
+    Takes ``field_names``, ``languages`` and ``populate_missing`` optional
+    keyword arguments.
+    """
+    from .mixins import ModelMixin
+
+    populate_missing = kwargs.get('populate_missing', True)
+    populated_scope = utils.get_populated_scope(**kwargs)
+
+    by_decider = collections.defaultdict(list)
+    for instance in instances:
+        if isinstance(instance, ModelMixin):
+            by_decider[instance._linguist.decider].append(instance)
+
+    for decider, decider_instances in six.iteritems(by_decider):
+        object_ids = collections.defaultdict(set)
+        for instance in decider_instances:
+            object_ids[instance.linguist_identifier].add(instance.pk)
+
+        grouped_translations = utils.get_identifiers_grouped_translations(decider, object_ids, **kwargs)
+
+        for instance in decider_instances:
+            for translation in grouped_translations.get((instance.linguist_identifier, instance.pk), []):
+                instance._linguist.set_cache(instance=instance, translation=translation)
+            if populate_missing:
+                instance.populate_missing_translations(**populated_scope)
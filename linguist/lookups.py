@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+from django.db.models.constants import LOOKUP_SEP
+
+from . import utils
+
+
+class LookupParser(object):
+    """
+    Parser of a linguist model query lookups, shared by all its querysets.
+
+    Maps every lookup prefix (the part before transforms, ``title_fr`` in
+    ``title_fr__icontains``) to its ``(field_name, language, is_linguist)``
+    tuple, computed once per model from its concrete fields and supported
+    languages. Language is None for non-localized field names (``title``).
+    """
+
+    __slots__ = ('tables', 'prefixes', 'concrete_field_names', 'linguist_field_names')
+
+    def __init__(self, model, fields):
+        self.tables = utils.get_language_tables()
+        self.concrete_field_names = tuple(f[0].name for f in model._meta.get_concrete_fields_with_model())
+        self.linguist_field_names = tuple(fields) + tuple(utils.get_language_fields(fields))
+        self.prefixes = {}
+
+        for field_name in fields:
+            self.prefixes[field_name] = (field_name, None, True)
+            for language in self.tables.codes:
+                name = utils.build_localized_field_name(field_name, language)
+                self.prefixes[name] = (field_name, language, True)
+
+        # Concrete fields are never linguist lookups
+        for name in self.concrete_field_names:
+            self.prefixes[name] = (name, None, False)
+
+    def is_stale(self):
+        """
+        Returns True if supported languages have changed since the parser
+        was built.
+        """
+        return self.tables is not utils.get_language_tables()
+
+    def parse(self, lookup):
+        """
+        Returns ``(field_name, language, transforms)`` for the given linguist
+        lookup (``transforms`` being the lookup after the field name, or an
+        empty string) or None if it's not a linguist lookup.
+        """
+        prefix, _, transforms = lookup.partition(LOOKUP_SEP)
+        parsed = self.prefixes.get(prefix)
+        if parsed is None or not parsed[2]:
+            return None
+        return parsed[0], parsed[1], transforms
+
+    def get_field(self, name):
+        """
+        Returns ``(field_name, language)`` for the given linguist field name
+        (``title`` or ``title_fr``, without transforms) or None.
+        """
+        parsed = self.prefixes.get(name)
+        if parsed is None or not parsed[2]:
+            return None
+        return parsed[0], parsed[1]
+
+    def get_translation_lookup(self, identifier, lookup, value):
+        """
+        Returns the translation model lookup of the given linguist lookup
+        and value (see ``utils.get_translation_lookup()``). Non-localized
+        field names look up the default language value.
+        """
+        field_name, language, transforms = self.parse(lookup)
+
+        value_lookup = 'field_value%s%s' % (LOOKUP_SEP, transforms) if transforms else 'field_value'
+
+        return {
+            'field_name': field_name,
+            'identifier': identifier,
+            'language': language or utils.get_fallback_language(),
+            value_lookup: value,
+        }
+
+    def split(self, identifier, kwargs):
+        """
+        Splits the given filter kwargs in a single pass into concrete field
+        lookups and a list of translation model lookups, one per linguist
+        lookup (each one matches a different translation row).
+        """
+        cleaned_kwargs = {}
+        translation_lookups = []
+
+        for k, v in kwargs.items():
+            if self.parse(k) is None:
+                cleaned_kwargs[k] = v
+            else:
+                translation_lookups.append(self.get_translation_lookup(identifier, k, v))
+
+        return cleaned_kwargs, translation_lookups
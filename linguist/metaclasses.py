@@ -38,16 +38,11 @@ def default_value_getter(field):
     """
     When accessing to the name of the field itself, the value
     in the current language will be returned. Unless it's set,
-    the value in the default language will be returned.
+    the value in its fallback languages (``LINGUIST_FALLBACKS``)
+    then in the default language will be returned.
     """
     def default_value_func_getter(self):
-        localized_field = utils.build_localized_field_name(field, self._linguist.active_language)
-        value = getattr(self, localized_field)
-        if value:
-            return value
-
-        default_field = utils.build_localized_field_name(field, self.default_language)
-        return getattr(self, default_field)
+        return self._linguist.resolve_fallback(self, field)
 
     return default_value_func_getter
 
@@ -99,6 +94,7 @@ class ModelMeta(models.base.ModelBase):
 
     def __new__(cls, name, bases, attrs):
 
+        from .cache import TranslationIndex
         from .fields import CacheDescriptor, DefaultLanguageDescriptor
         from .mixins import ModelMixin
         from .models import Translation
@@ -162,7 +158,9 @@ class ModelMeta(models.base.ModelBase):
         # instance._linguist / instance.default_language descriptors
         #
 
-        setattr(new_class, '_linguist', CacheDescriptor(meta=meta))
+        index = TranslationIndex(meta['fields'], [lang[LANGUAGE_CODE] for lang in settings.SUPPORTED_LANGUAGES])
+
+        setattr(new_class, '_linguist', CacheDescriptor(meta=meta, index=index, model=new_class))
         setattr(new_class, 'default_language', DefaultLanguageDescriptor())
 
         #
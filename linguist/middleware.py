@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from .cache import activate_identity_map, deactivate_identity_map
+
+
+class IdentityMapMiddleware(object):
+    """
+    Keeps loaded translations in an identity map for the duration of the
+    request: translations of an object are fetched at most once per request.
+    """
+
+    def __init__(self, get_response=None):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        self.process_request(request)
+        try:
+            return self.get_response(request)
+        finally:
+            deactivate_identity_map()
+
+    def process_request(self, request):
+        # A map left by a previous request of this thread (if its response
+        # was never processed) must not be reused.
+        deactivate_identity_map()
+        activate_identity_map()
+
+    def process_response(self, request, response):
+        deactivate_identity_map()
+        return response
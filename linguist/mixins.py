@@ -3,16 +3,24 @@ import copy
 import itertools
 import six
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 
 import django
-from django.db.models import Q
-from django.utils.functional import cached_property
+from django.core.exceptions import FieldError
+from django.db import connections, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Coalesce
 
-from . import utils
+from . import settings, utils
 from .cache import CachedTranslation
-from .helpers import prefetch_translations
+from .expressions import TranslationValue
+from .helpers import prefetch_related_translations, prefetch_translations
+
+
+# Default number of rows per batch of streamed translations
+STREAM_BATCH_SIZE = 2000
 
 
 class QuerySetMixin(object):
@@ -23,43 +31,125 @@ class QuerySetMixin(object):
     def __init__(self, *args, **kwargs):
         self._prefetched_translations_cache = kwargs.pop('_prefetched_translations_cache', [])
         self._prefetch_translations_done = kwargs.pop('_prefetch_translations_done', False)
+        self._prefetched_translations_scope = kwargs.pop('_prefetched_translations_scope', {})
+        self._translated_field_names = kwargs.pop('_translated_field_names', None)
+        self._translated_columns = kwargs.pop('_translated_columns', [])
+        self._translations_stream = kwargs.pop('_translations_stream', None)
+        self._translations_relations = kwargs.pop('_translations_relations', [])
+        self._translations_fallback = kwargs.pop('_translations_fallback', None)
         super(QuerySetMixin, self).__init__(*args, **kwargs)
 
     def _filter_or_exclude(self, negate, *args, **kwargs):
         """
         Overrides default behavior to handle linguist fields.
+
+        Each linguist lookup is compiled into a ``pk IN (SELECT object_id ...)``
+        subquery on the decider table, so the whole filter runs in a single
+        (lazy) query, whatever the number of matching translations.
+
+        With fallback lookups (see ``with_fallback()``), non-localized field
+        names are compiled into the value in the active language, falling
+        back to the default language one.
         """
-        from .models import Translation
+        clone = self
 
-        new_args = self.get_cleaned_args(args)
-        new_kwargs = self.get_cleaned_kwargs(kwargs)
+        if self.fallback_lookups:
+            clone, args, kwargs = self.with_fallback_annotations(args, kwargs)
 
-        translation_args = self.get_translation_args(args)
-        translation_kwargs = self.get_translation_kwargs(kwargs)
+        new_args = clone.get_cleaned_args(args)
+        translation_args = clone.get_translation_args(args)
 
-        has_linguist_args = self.has_linguist_args(args)
-        has_linguist_kwargs = self.has_linguist_kwargs(kwargs)
+        new_kwargs, translation_lookups = self.linguist_lookups.split(self.model._linguist.identifier, kwargs)
 
-        if translation_args or translation_kwargs:
-            ids = list(set(Translation.objects.filter(*translation_args, **translation_kwargs)
-                                              .values_list('object_id', flat=True)))
-            if ids:
-                new_kwargs['id__in'] = ids
+        # Lookups on different fields or languages match different rows
+        decider = self.model._linguist.decider
+        conditions = translation_args + [Q(**lookup) for lookup in translation_lookups]
 
-        has_kwargs = has_linguist_kwargs and not (new_kwargs or new_args)
-        has_args = has_linguist_args and not (new_args or new_kwargs)
+        if conditions:
+            new_args = list(new_args) + [Q(pk__in=decider.objects.filter(condition).values('object_id'))
+                                         for condition in conditions]
 
-        # No translations but we looked for translations?
-        # Returns empty queryset.
-        if has_kwargs or has_args:
-            return self._clone().none()
+        clone = super(QuerySetMixin, clone)._filter_or_exclude(negate, *new_args, **new_kwargs)
 
-        return super(QuerySetMixin, self)._filter_or_exclude(negate, *new_args, **new_kwargs)
+        return clone.remove_fallback_annotations()
+
+    @property
+    def fallback_lookups(self):
+        """
+        Returns True if non-localized field lookups fall back to the default
+        language value (defaults to ``LINGUIST_FALLBACK_LOOKUPS`` setting).
+        """
+        if self._translations_fallback is None:
+            return settings.FALLBACK_LOOKUPS
+        return self._translations_fallback
+
+    def with_fallback_annotations(self, args, kwargs):
+        """
+        Annotates the non-localized linguist fields of the given lookups with
+        their value in the active language, falling back to the default
+        language one (``COALESCE``). Returns the annotated queryset and the
+        lookups rewritten on annotations.
+        """
+        names = []
+
+        def rename(lookup):
+            parsed = self.linguist_lookups.parse(lookup)
+            if parsed is None or parsed[1] is not None:
+                return lookup
+            field_name, language, transforms = parsed
+            if field_name not in names:
+                names.append(field_name)
+            return LOOKUP_SEP.join(filter(None, ['_linguist_fallback_%s' % field_name, transforms]))
+
+        def rename_condition(condition):
+            if isinstance(condition, Q):
+                condition = copy.copy(condition)
+                condition.children = [rename_condition(child) for child in condition.children]
+                return condition
+            lookup, value = condition
+            return rename(lookup), value
+
+        args = [rename_condition(arg) for arg in args]
+        kwargs = dict((rename(k), v) for k, v in six.iteritems(kwargs))
+
+        if not names:
+            return self, args, kwargs
+
+        clone = self._clone()
+        for name in names:
+            alias = '_linguist_fallback_%s' % name
+            if alias not in clone.query.annotations:
+                # Not through annotate(): lookups are not resolved yet
+                clone.query.add_annotation(self.get_translation_expression(name), alias, is_summary=False)
+        return clone, args, kwargs
+
+    def remove_fallback_annotations(self):
+        """
+        Removes the annotations of ``with_fallback_annotations()`` once
+        lookups are resolved (conditions embed their expression): selecting
+        them would compute them twice per row.
+        """
+        query = self.query
+        aliases = [alias for alias in query.annotations if alias.startswith('_linguist_fallback_')]
+        if not aliases:
+            return self
+        for alias in aliases:
+            del query.annotations[alias]
+        if query.annotation_select_mask is not None:
+            query.set_annotation_mask(query.annotation_select_mask.difference(aliases))
+        query._annotation_select_cache = None
+        return self
 
     def _clone(self, klass=None, setup=False, **kwargs):
         kwargs.update({
             '_prefetched_translations_cache': self._prefetched_translations_cache,
             '_prefetch_translations_done': self._prefetch_translations_done,
+            '_prefetched_translations_scope': self._prefetched_translations_scope,
+            '_translated_field_names': self._translated_field_names,
+            '_translated_columns': self._translated_columns,
+            '_translations_stream': self._translations_stream,
+            '_translations_relations': self._translations_relations,
+            '_translations_fallback': self._translations_fallback,
         })
 
         if django.VERSION < (1, 9):
@@ -70,9 +160,75 @@ class QuerySetMixin(object):
 
         return super(QuerySetMixin, self)._clone(**kwargs)
 
+    def _fetch_all(self):
+        fetched = self._result_cache is None
+        super(QuerySetMixin, self)._fetch_all()
+        if fetched:
+            self.attach_siblings(self._result_cache)
+
+    def attach_siblings(self, objs):
+        """
+        Attaches the instances of the result cache to each other, so that
+        instances without prefetched translations load them all at once, on
+        first access (see ``Linguist.prefetch_siblings``). Fields deferred
+        with only() / defer() are loaded apart, the same way.
+
+        Not done by iterator(), which does not keep rows alive.
+        """
+        siblings = self.get_siblings_groups()
+
+        if not siblings:
+            return
+
+        instances = [obj for obj in objs if isinstance(obj, self.model)]
+        groups = list(dict((id(group), group) for group in siblings.values()).values())
+
+        for obj in instances:
+            obj._linguist_siblings = siblings
+
+        for group in groups:
+            group.extend(instances)
+
     def iterator(self):
+        if self._translations_stream is None and not self._translations_relations:
+            for obj in self._linguist_iterator():
+                yield obj
+            return
+
+        # Streamed translations and related instances translations: loaded
+        # batch by batch, along with rows.
+        options = dict(self._translations_stream or {})
+        batch_size = options.pop('batch_size', STREAM_BATCH_SIZE)
+        batch = []
+
+        for obj in self._linguist_iterator():
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                for obj in self._prefetch_batch_translations(batch, **options):
+                    yield obj
+                batch = []
+
+        for obj in self._prefetch_batch_translations(batch, **options):
+            yield obj
+
+    def _prefetch_batch_translations(self, objs, **kwargs):
+        """
+        Prefetches translations of the model instances among the given objects
+        (if streamed) and of their related instances, then returns them all.
+        """
+        instances = [obj for obj in objs if isinstance(obj, self.model)]
+        if instances:
+            if self._translations_stream is not None:
+                prefetch_translations(instances, **kwargs)
+            if self._translations_relations:
+                prefetch_related_translations(instances, *self._translations_relations)
+        return objs
+
+    def _linguist_iterator(self):
+        distinct_aliases = [alias for alias in self.query.annotation_select if alias.startswith('_linguist_distinct_')]
+
         for obj in super(QuerySetMixin, self).iterator():
-            if obj and not isinstance(obj, self.model):
+            if not isinstance(obj, self.model):
                 yield obj
                 continue
 
@@ -81,24 +237,66 @@ class QuerySetMixin(object):
             if obj.pk in self._prefetched_translations_cache:
                 for translation in self._prefetched_translations_cache[obj.pk]:
                     obj._linguist.set_cache(instance=obj, translation=translation)
-                obj.populate_missing_translations()
+                obj.populate_missing_translations(**self._prefetched_translations_scope)
+
+            for alias in distinct_aliases:
+                obj.__dict__.pop(alias, None)
+
+            for alias, field_name, language in self._translated_columns:
+                value = obj.__dict__.pop(alias, None)
+                obj._linguist_translations.set(field_name, language, CachedTranslation(instance=obj,
+                                                                                       language=language,
+                                                                                       field_name=field_name,
+                                                                                       field_value=value,
+                                                                                       is_new=value is None))
 
             yield obj
 
-    @cached_property
+    def get_siblings_groups(self):
+        """
+        Returns a ``{field_name: instances}`` dictionary of the translatable
+        fields loaded on first access, for all instances at once. Fields
+        loaded together share the same instances list.
+        """
+        fields = self.model._linguist.fields
+        scope = self._translated_field_names
+        deferred = [] if scope is None else [field for field in fields if field not in scope]
+
+        groups = {}
+
+        if not self._prefetch_translations_done:
+            group = []
+            for field in fields:
+                if field not in deferred:
+                    groups[field] = group
+
+        if deferred:
+            group = []
+            for field in deferred:
+                groups[field] = group
+
+        return groups
+
+    @property
+    def linguist_lookups(self):
+        """
+        Returns the model lookup parser (shared by all its querysets).
+        """
+        return self.model._linguist.lookups
+
+    @property
     def concrete_field_names(self):
         """
         Returns model concrete field names.
         """
-        return [f[0].name for f in self.model._meta.get_concrete_fields_with_model()]
+        return self.linguist_lookups.concrete_field_names
 
-    @cached_property
+    @property
     def linguist_field_names(self):
         """
         Returns linguist field names (example: "title" and "title_fr").
         """
-        return (list(self.model._linguist.fields) +
-                list(utils.get_language_fields(self.model._linguist.fields)))
+        return self.linguist_lookups.linguist_field_names
 
     def has_linguist_kwargs(self, kwargs):
         """
@@ -135,33 +333,27 @@ class QuerySetMixin(object):
 
     def get_translation_kwargs(self, kwargs):
         """
-        Returns linguist lookup kwargs (related to Translation model).
+        Returns linguist lookup kwargs (related to Translation model), as a
+        list of lookups: one per linguist lookup.
         """
-        lks = []
-        for k, v in six.iteritems(kwargs):
-            if self.is_linguist_lookup(k):
-                lks.append(utils.get_translation_lookup(
-                    self.model._linguist.identifier, k, v))
-
-        translation_kwargs = {}
-        for lk in lks:
-            for k, v in six.iteritems(lk):
-                if k not in translation_kwargs:
-                    translation_kwargs[k] = v
-
-        return translation_kwargs
+        return self.linguist_lookups.split(self.model._linguist.identifier, kwargs)[1]
 
     def is_linguist_lookup(self, lookup):
         """
         Returns true if the given lookup is a valid linguist lookup.
         """
-        field = utils.get_field_name_from_lookup(lookup)
-
         # To keep default behavior with "FieldError: Cannot resolve keyword".
-        if (field not in self.concrete_field_names and field in self.linguist_field_names):
-            return True
+        return self.linguist_lookups.parse(lookup) is not None
 
-        return False
+    def get_linguist_field(self, name):
+        """
+        Returns ``(field_name, language)`` for the given linguist field name
+        (``title`` or ``title_fr``) or None. Language is None for a
+        non-localized field name.
+        """
+        if not isinstance(name, six.string_types):
+            return None
+        return self.linguist_lookups.get_field(name)
 
     def _get_linguist_condition(self, condition, reverse=False, transform=False):
         """
@@ -189,9 +381,9 @@ class QuerySetMixin(object):
         is_linguist = self.is_linguist_lookup(lookup)
 
         if transform and is_linguist:
-            return Q(**utils.get_translation_lookup(self.model._linguist.identifier,
-                                                    lookup,
-                                                    value))
+            return Q(**self.linguist_lookups.get_translation_lookup(self.model._linguist.identifier,
+                                                                    lookup,
+                                                                    value))
 
         if (reverse and not is_linguist) or (not reverse and is_linguist):
             return condition
@@ -215,35 +407,370 @@ class QuerySetMixin(object):
         """
         Returns concrete field lookups.
         """
-        cleaned_kwargs = kwargs.copy()
+        return self.linguist_lookups.split(self.model._linguist.identifier, kwargs)[0]
 
-        if kwargs is not None:
-            for k in kwargs:
-                if self.is_linguist_lookup(k):
-                    del cleaned_kwargs[k]
+    def get_translation_expression(self, field_name, fallback=True):
+        """
+        Returns the SQL expression of a linguist field (``title`` or
+        ``title_fr``), falling back to the values in its fallback languages
+        then in the default language (unless ``fallback`` is False). A
+        non-localized field name uses the active language.
+        """
+        field_name, language = self.get_linguist_field(field_name)
+
+        if language is None:
+            language = utils.get_language()
+
+        if not fallback:
+            return TranslationValue(field_name, language)
+
+        languages = utils.get_fallback_languages(language, self.model._linguist.default_language)
 
-        return cleaned_kwargs
+        if len(languages) == 1:
+            return TranslationValue(field_name, language)
+
+        return Coalesce(*[TranslationValue(field_name, lang) for lang in languages])
+
+    def order_by(self, *field_names):
+        """
+        Overrides default behavior to handle linguist fields.
+        """
+        ordering = []
+        for field_name in field_names:
+            if isinstance(field_name, six.string_types):
+                descending = field_name.startswith('-')
+                name = field_name.lstrip('-')
+                if self.get_linguist_field(name) is not None:
+                    expression = self.get_translation_expression(name)
+                    field_name = expression.desc() if descending else expression.asc()
+            ordering.append(field_name)
+        return super(QuerySetMixin, self).order_by(*ordering)
 
-    def with_translations(self, **kwargs):
+    def annotate(self, *args, **kwargs):
+        """
+        Overrides default behavior to handle linguist fields in expressions.
+        """
+        return super(QuerySetMixin, self).annotate(**self.get_translated_annotations(args, kwargs))
+
+    def aggregate(self, *args, **kwargs):
+        """
+        Overrides default behavior to handle linguist fields in expressions.
+        """
+        return super(QuerySetMixin, self).aggregate(**self.get_translated_annotations(args, kwargs))
+
+    def distinct(self, *field_names):
+        """
+        Overrides default behavior to handle linguist fields (``DISTINCT ON``
+        translated values, selected as columns). Values are the ones
+        ``order_by()`` sorts on, fallback languages included, as PostgreSQL
+        requires ``DISTINCT ON`` expressions to match the leading ordering.
+        """
+        annotations = OrderedDict()
+        names = []
+
+        for name in field_names:
+            if name not in self.query.annotations and self.get_linguist_field(name) is not None:
+                alias = '_linguist_distinct_%s' % name
+                annotations[alias] = self.get_translation_expression(name)
+                name = alias
+            names.append(name)
+
+        clone = super(QuerySetMixin, self).annotate(**annotations) if annotations else self
+        return super(QuerySetMixin, clone).distinct(*names)
+
+    def get_translated_annotations(self, args, kwargs):
+        """
+        Returns ``annotate()`` and ``aggregate()`` arguments as a dictionary
+        of expressions, where linguist fields references are replaced by
+        their translation expression (see ``get_translated_expression()``).
+        """
+        annotations = OrderedDict()
+
+        for arg in args:
+            try:
+                alias = arg.default_alias
+            except (AttributeError, TypeError):
+                raise TypeError('Complex annotations require an alias')
+            annotations[alias] = arg
+
+        annotations.update(kwargs)
+
+        return OrderedDict((alias, self.get_translated_expression(annotation))
+                           for alias, annotation in six.iteritems(annotations))
+
+    def get_translated_expression(self, expression):
+        """
+        Returns the given expression, where ``F()`` references to linguist
+        fields are replaced by their translation expression: ``title_fr`` is
+        the French value and ``title`` the value in the active language,
+        falling back to the default language one.
+        """
+        if isinstance(expression, F):
+            field = self.get_linguist_field(expression.name)
+            if field is not None:
+                return self.get_translation_expression(expression.name, fallback=field[1] is None)
+            return expression
+
+        if not hasattr(expression, 'get_source_expressions'):
+            return expression
+
+        sources = expression.get_source_expressions()
+        translated = [self.get_translated_expression(source) for source in sources]
+
+        if all(a is b for a, b in zip(sources, translated)):
+            return expression
+
+        expression = expression.copy()
+        expression.set_source_expressions(translated)
+        return expression
+
+    def values(self, *fields):
+        """
+        Overrides default behavior to handle linguist fields.
+        """
+        return super(QuerySetMixin, self.with_translation_annotations(fields)).values(*fields)
+
+    def values_list(self, *fields, **kwargs):
+        """
+        Overrides default behavior to handle linguist fields.
+        """
+        return super(QuerySetMixin, self.with_translation_annotations(fields)).values_list(*fields, **kwargs)
+
+    def with_translation_annotations(self, field_names):
+        """
+        Annotates the given linguist field names with their translated value,
+        under the same name: ``title_fr`` is the French value, ``title`` the
+        value in the active language, falling back to the default language
+        one (as instances do).
+        """
+        fields = [(name, self.get_linguist_field(name)) for name in field_names]
+        fields = [(name, field) for name, field in fields if field is not None]
+
+        if not fields:
+            return self
+
+        clone = self._clone()
+        for name, (field_name, language) in fields:
+            # Not through annotate(): names would conflict with translation fields
+            expression = clone.get_translation_expression(name, fallback=language is None)
+            clone.query.add_annotation(expression, name, is_summary=False)
+        return clone
+
+    def get_translated_field_names(self, field_names):
+        """
+        Splits the given field names into other fields and translatable fields
+        (``title`` and ``title_fr`` both stand for ``title``).
+        """
+        others, translated = [], []
+        for field_name in field_names:
+            field = self.get_linguist_field(field_name)
+            if field is not None:
+                name = field[0]
+                if name not in translated:
+                    translated.append(name)
+            else:
+                others.append(field_name)
+        return others, translated
+
+    def only(self, *fields):
+        """
+        Overrides default behavior to handle linguist fields: translations of
+        other fields are not prefetched, but loaded on access (in a single
+        query for all instances).
+        """
+        others, translated = self.get_translated_field_names(fields)
+        clone = super(QuerySetMixin, self).only(*(others or [self.model._meta.pk.name]))
+        clone._translated_field_names = translated
+        return clone
+
+    def defer(self, *fields):
+        """
+        Overrides default behavior to handle linguist fields: translations of
+        deferred fields are not prefetched, but loaded on access (in a single
+        query for all instances).
+        """
+        if fields == (None,):
+            clone = super(QuerySetMixin, self).defer(None)
+            clone._translated_field_names = None
+            return clone
+
+        others, translated = self.get_translated_field_names(fields)
+        clone = super(QuerySetMixin, self).defer(*others) if others else self._clone()
+        scope = self._translated_field_names
+        if scope is None:
+            scope = self.model._linguist.fields
+        clone._translated_field_names = [field for field in scope if field not in translated]
+        return clone
+
+    def with_translations(self, *relations, **kwargs):
         """
         Prefetches translations.
 
-        Takes three optional keyword arguments:
+        Takes related field names (``'category'``, ``'tags'``, etc.): translations
+        of related linguist instances of the whole result set are prefetched as
+        well, with one query per decider.
+
+        Takes optional keyword arguments:
 
         * ``field_names``: ``field_name`` values for SELECT IN
         * ``languages``: ``language`` values for SELECT IN
         * ``chunks_length``: fetches IDs by chunk
+        * ``chunks_workers``: number of threads fetching chunks concurrently
+        * ``using``: database alias to read translations from
+        * ``active_languages``: only prefetches active and fallback languages
+          (defaults to ``LINGUIST_PREFETCH_ACTIVE_LANGUAGES`` setting)
+
+        With ``stream=True``, the queryset is not evaluated: translations are
+        loaded along with rows, by batches of ``batch_size`` instances (2000
+        by default). Combined with ``iterator()``, only one batch of instances
+        and translations is kept in memory at a time (rows are still buffered
+        by the database driver).
         """
 
         force = kwargs.pop('force', False)
+        stream = kwargs.pop('stream', False)
+        batch_size = kwargs.pop('batch_size', None) or STREAM_BATCH_SIZE
+
+        # Fields deferred with only() / defer() are loaded on access
+        if self._translated_field_names is not None and 'field_names' not in kwargs:
+            kwargs.update(field_names=self._translated_field_names, deferred=True)
 
         if self._prefetch_translations_done and force is False:
-            return self
+            clone = self
+        elif stream:
+            clone = self._clone()
+            clone._translations_stream = dict(kwargs, batch_size=batch_size)
+            clone._prefetch_translations_done = True
+        else:
+            self._prefetched_translations_cache = utils.get_grouped_translations(self, **kwargs)
+            self._prefetched_translations_scope = utils.get_populated_scope(**kwargs)
+            self._prefetch_translations_done = True
+            clone = self._clone()
+
+        if relations:
+            clone = clone._clone()
+            clone._translations_relations = clone._translations_relations + list(relations)
+
+        return clone
+
+    def with_translated_columns(self, *field_names, **kwargs):
+        """
+        Selects translations as columns of the main query (no extra query).
+
+        Takes the translatable field names to select (defaults to all
+        fields) and an optional ``languages`` keyword argument (defaults
+        to the active language).
+        """
+        field_names = field_names or self.model._linguist.fields
+
+        languages = kwargs.get('languages', kwargs.get('language', None))
+        if languages is None:
+            languages = utils.get_language()
+        if not isinstance(languages, (list, tuple)):
+            languages = [languages]
+
+        annotations = {}
+        translated_columns = list(self._translated_columns)
+
+        for field_name in field_names:
+            if field_name not in self.model._linguist.fields:
+                raise FieldError('Cannot resolve keyword %r into a translatable field. '
+                                 'Choices are: %s' % (field_name, ', '.join(self.model._linguist.fields)))
+            for language in languages:
+                alias = '_linguist_%s' % utils.build_localized_field_name(field_name, language)
+                annotations[alias] = TranslationValue(field_name, language)
+                translated_columns.append((alias, field_name, language))
+
+        clone = self.annotate(**annotations)
+        clone._translated_columns = translated_columns
 
-        self._prefetched_translations_cache = utils.get_grouped_translations(self, **kwargs)
-        self._prefetch_translations_done = True
+        return clone
 
-        return self._clone()
+    def with_fallback(self, *field_names, **kwargs):
+        """
+        Enables fallback lookups: filtering on a non-localized field name
+        (``title``) uses the value in the active language, falling back to
+        its fallback languages then default language ones, in one SQL
+        expression (``COALESCE``).
+
+        Takes the translatable field names to select as columns in all these
+        languages (see ``with_translated_columns()``), so that their values
+        are read without extra query. Pass ``enabled=False`` to filter on
+        the default language value only.
+        """
+        clone = self._clone()
+        clone._translations_fallback = kwargs.get('enabled', True)
+
+        if not field_names:
+            return clone
+
+        languages = utils.get_fallback_languages(default_language=self.model._linguist.default_language)
+
+        return clone.with_translated_columns(*field_names, languages=languages)
+
+    def bulk_create(self, objs, batch_size=None):
+        """
+        Overrides default behavior to save cached translations of the
+        created objects, in one batched operation (``batch_size`` objects or
+        translations per statement).
+        """
+        objs = list(objs)
+        connection = connections[self.db]
+
+        if not getattr(connection.features, 'can_return_ids_from_bulk_insert', False):
+            for obj in objs:
+                if obj.pk is None and any(t.field_value for t in obj._linguist.dirty_translation_instances):
+                    raise ValueError("Can't save translations of objects without primary key "
+                                     "with bulk_create(). Set their primary key first.")
+
+        objs = super(QuerySetMixin, self).bulk_create(objs, batch_size=batch_size)
+
+        self.model._linguist.decider.objects.save_translations(objs, batch_size=batch_size)
+
+        return objs
+
+    def bulk_update(self, objs, fields=None, batch_size=None):
+        """
+        Updates the given concrete ``fields`` of objects, then saves their cached
+        translations, in batched operations (``batch_size`` objects or
+        translations per statement).
+        """
+        objs = list(objs)
+
+        if not objs:
+            return
+
+        fields = [self.model._meta.get_field(name) for name in (fields or [])
+                  if name not in self.linguist_field_names]
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            if fields:
+                if hasattr(super(QuerySetMixin, self), 'bulk_update'):
+                    super(QuerySetMixin, self).bulk_update(objs, [f.name for f in fields], batch_size=batch_size)
+                else:
+                    self._batched_update(objs, fields, batch_size)
+
+            self.model._linguist.decider.objects.save_translations(objs, batch_size=batch_size)
+
+    def _batched_update(self, objs, fields, batch_size=None):
+        """
+        Updates ``fields`` of objects with one ``UPDATE ... CASE WHEN``
+        statement per batch (Django < 2.2 has no ``bulk_update()``).
+        """
+        connection = connections[self.db]
+        # Each object binds its pk and value in the CASE of each field, and
+        # its pk in the IN clause
+        params = ['pk'] * (2 * len(fields) + 1)
+        batch_size = batch_size or max(connection.ops.bulk_batch_size(params, objs), 1)
+
+        for i in range(0, len(objs), batch_size):
+            batch = objs[i:i + batch_size]
+            values = {}
+            for field in fields:
+                whens = [When(pk=obj.pk, then=Value(getattr(obj, field.attname), output_field=field))
+                         for obj in batch]
+                values[field.attname] = Case(*whens, output_field=field)
+            self.filter(pk__in=[obj.pk for obj in batch]).update(**values)
 
     def activate_language(self, language):
         """
@@ -263,11 +790,29 @@ class ManagerMixin(object):
         QuerySet = type('LinguistQuerySet', (QuerySetMixin, models.query.QuerySet), {})
         return QuerySet(self.model)
 
-    def with_translations(self, **kwargs):
+    def with_translations(self, *relations, **kwargs):
         """
         Proxy for ``QuerySetMixin.with_translations()`` method.
         """
-        return self.get_queryset().with_translations(**kwargs)
+        return self.get_queryset().with_translations(*relations, **kwargs)
+
+    def with_translated_columns(self, *field_names, **kwargs):
+        """
+        Proxy for ``QuerySetMixin.with_translated_columns()`` method.
+        """
+        return self.get_queryset().with_translated_columns(*field_names, **kwargs)
+
+    def with_fallback(self, *field_names, **kwargs):
+        """
+        Proxy for ``QuerySetMixin.with_fallback()`` method.
+        """
+        return self.get_queryset().with_fallback(*field_names, **kwargs)
+
+    def bulk_update(self, objs, fields=None, batch_size=None):
+        """
+        Proxy for ``QuerySetMixin.bulk_update()`` method.
+        """
+        return self.get_queryset().bulk_update(objs, fields=fields, batch_size=batch_size)
 
     def activate_language(self, language):
         """
@@ -278,6 +823,13 @@ class ManagerMixin(object):
 
 class ModelMixin(object):
 
+    def __reduce__(self):
+        # Instances loaded along with this one are not pickled with it
+        reduced = super(ModelMixin, self).__reduce__()
+        state = dict(reduced[2])
+        state.pop('_linguist_siblings', None)
+        return reduced[:2] + (state,) + reduced[3:]
+
     def prefetch_translations(self, *args, **kwargs):
         if not self.pk:
             return
@@ -286,23 +838,15 @@ class ModelMixin(object):
 
         if args:
             fields = [arg for arg in args if arg in self._meta.get_all_field_names()]
-            for field in fields:
-                f = self._meta.get_field(field)
-                value = getattr(self, f.name, None)
-                if issubclass(value.__class__, ModelMixin):
-                    value.prefetch_translations()
-
-    def populate_missing_translations(self):
-        for field in self._linguist.fields:
-            if field in self._linguist.translations:
-                languages = self._linguist.translations[field]
-                missing_languages = list(set(self._linguist.supported_languages) - set(languages.keys()))
-                for language in missing_languages:
-                    self._linguist.translations[field][language] = CachedTranslation()
-            else:
-                self._linguist.translations[field] = {}
-                for language in self._linguist.supported_languages:
-                    self._linguist.translations[field][language] = CachedTranslation()
+            prefetch_related_translations([self], *fields)
+
+    def populate_missing_translations(self, languages=None, field_names=None):
+        """
+        Flags translations not loaded in cache as missing (placeholders are
+        created on access), for the given languages and fields (defaults to
+        all).
+        """
+        self._linguist.translations.mark_missing(languages, field_names)
 
     @property
     def linguist_identifier(self):
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+from collections import OrderedDict
+
 from django.db import (
     IntegrityError,
+    connections,
     models,
     transaction,
 )
@@ -9,6 +12,22 @@ from django.utils.encoding import python_2_unicode_compatible
 from django.utils.translation import ugettext_lazy as _
 
 from .. import settings
+from ..cache import invalidate_cached_translations
+
+
+# Columns written by upserts, the unique key first and the value last
+UPSERT_FIELDS = ('identifier', 'object_id', 'language', 'field_name', 'field_value')
+
+
+def supports_upsert(connection):
+    """
+    Returns True if the database supports ``INSERT ... ON CONFLICT DO UPDATE``.
+    """
+    if connection.vendor == 'postgresql':
+        return connection.pg_version >= 90500
+    if connection.vendor == 'sqlite':
+        return connection.Database.sqlite_version_info >= (3, 24, 0)
+    return False
 
 
 class TranslationQuerySet(models.query.QuerySet):
@@ -24,7 +43,7 @@ class TranslationQuerySet(models.query.QuerySet):
         if language is not None:
             lookup['language'] = language
 
-        return self.get_queryset().filter(**lookup)
+        return self.filter(**lookup)
 
 
 class TranslationManager(models.Manager):
@@ -40,6 +59,7 @@ class TranslationManager(models.Manager):
         Shortcut method to delete translations for a given object.
         """
         self.get_translations(obj, language).delete()
+        invalidate_cached_translations(self.model, [(obj.linguist_identifier, obj.pk)])
 
     def get_languages(self):
         """
@@ -50,44 +70,156 @@ class TranslationManager(models.Manager):
                 .distinct()
                 .order_by('language'))
 
-    def save_translations(self, instances):
+    def save_translations(self, instances, batch_size=None):
         """
-        Saves cached translations (cached in model instances as dictionaries).
+        Saves cached translations (cached in model instances as dictionaries),
+        inserting at most ``batch_size`` translations per statement.
         """
         if not isinstance(instances, (list, tuple)):
             instances = [instances]
 
-        for instance in instances:
+        if self.can_upsert():
+            return self.upsert_translations(instances, batch_size=batch_size)
+
+        return self.create_or_update_translations(instances, batch_size=batch_size)
 
-            translations = []
+    def create_or_update_translations(self, instances, batch_size=None):
+        """
+        Saves cached translations of the given instances with bulk inserts
+        (of ``batch_size`` translations) and updates. Rows created concurrently
+        in the meantime are updated instead, one by one.
+        """
+        saved = []
 
-            for obj in instance._linguist.translation_instances:
-                if obj.field_name:
-                    obj.object_id = instance.pk
-                    translations.append(obj)
+        for instance in instances:
+
+            translations = self.get_cached_translations(instance)
 
             to_create = [(obj, self.model(**obj.attrs)) for obj in translations if obj.is_new and obj.field_value]
             to_update = [obj for obj in translations if obj.has_changed and not obj.is_new]
 
-            created = True
-
             if to_create:
                 objects = [obj for cached, obj in to_create]
                 try:
                     with transaction.atomic():
-                        self.bulk_create(objects)
+                        self.bulk_create(objects, batch_size=batch_size)
                 except IntegrityError:
-                    created = False
+                    for cached, obj in to_create:
+                        self.create_or_update_translation(cached)
+
+                for cached, obj in to_create:
+                    cached.is_new = False
+                    cached.has_changed = False
 
             if to_update:
                 for obj in to_update:
                     self.filter(**obj.lookup).update(field_value=obj.field_value)
                     obj.has_changed = False
 
-            if created:
-                for cached, obj in to_create:
-                    cached.is_new = False
-                    cached.has_changed = False
+            if to_create or to_update:
+                saved.append((instance.linguist_identifier, instance.pk))
+
+            instance._linguist.translations.mark_clean()
+
+        invalidate_cached_translations(self.model, saved)
+
+    def create_or_update_translation(self, obj):
+        """
+        Saves a single cached translation, whether its row exists or not
+        (even if created concurrently), in at most three statements.
+        """
+        if self.filter(**obj.lookup).update(field_value=obj.field_value):
+            return
+
+        try:
+            with transaction.atomic():
+                self.create(**obj.attrs)
+        except IntegrityError:
+            self.filter(**obj.lookup).update(field_value=obj.field_value)
+
+    def can_upsert(self):
+        """
+        Returns True if translations can be saved with upserts: the database
+        supports them, the model has the unique key they rely on and no other
+        column (upserts only write ``UPSERT_FIELDS``, skipping defaults and
+        ``pre_save()`` of other fields).
+        """
+        unique_key = set(UPSERT_FIELDS[:-1])
+
+        if not any(set(fields) == unique_key for fields in self.model._meta.unique_together):
+            return False
+
+        if any(not field.primary_key and field.name not in UPSERT_FIELDS
+               for field in self.model._meta.concrete_fields):
+            return False
+
+        return supports_upsert(connections[self.db])
+
+    def upsert_translations(self, instances, batch_size=None):
+        """
+        Saves cached translations of all the given instances with batched
+        ``INSERT ... ON CONFLICT DO UPDATE`` statements, of at most
+        ``batch_size`` translations each.
+        """
+        translations = []
+
+        for instance in instances:
+            translations.extend(obj for obj in self.get_cached_translations(instance)
+                                if (obj.is_new and obj.field_value) or (obj.has_changed and not obj.is_new))
+
+        # A row can't be upserted twice by the same statement (copies of the
+        # same instance): the last value wins.
+        rows = OrderedDict()
+        for obj in translations:
+            rows[tuple(getattr(obj, name) for name in UPSERT_FIELDS[:-1])] = obj
+        rows = list(rows.values())
+
+        if rows:
+            connection = connections[self.db]
+            qn = connection.ops.quote_name
+            fields = [self.model._meta.get_field(name) for name in UPSERT_FIELDS]
+            placeholder = '(%s)' % ', '.join(['%s'] * len(fields))
+            max_batch_size = max(connection.ops.bulk_batch_size(fields, rows), 1)
+            batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+
+            sql = 'INSERT INTO %s (%s) VALUES %%s ON CONFLICT (%s) DO UPDATE SET %s = EXCLUDED.%s' % (
+                qn(self.model._meta.db_table),
+                ', '.join(qn(field.column) for field in fields),
+                ', '.join(qn(field.column) for field in fields[:-1]),
+                qn(fields[-1].column),
+                qn(fields[-1].column))
+
+            with transaction.atomic(using=self.db, savepoint=False):
+                with connection.cursor() as cursor:
+                    for i in range(0, len(rows), batch_size):
+                        batch = rows[i:i + batch_size]
+                        params = [field.get_db_prep_save(getattr(obj, field.name), connection)
+                                  for obj in batch
+                                  for field in fields]
+                        cursor.execute(sql % ', '.join([placeholder] * len(batch)), params)
+
+        for obj in translations:
+            obj.is_new = False
+            obj.has_changed = False
+
+        invalidate_cached_translations(self.model, set((obj.identifier, obj.object_id) for obj in translations))
+
+        for instance in instances:
+            instance._linguist.translations.mark_clean()
+
+    def get_cached_translations(self, instance):
+        """
+        Returns cached translations of the given instance with unsaved
+        changes, bound to its pk.
+        """
+        translations = []
+
+        for obj in instance._linguist.dirty_translation_instances:
+            if obj.field_name:
+                obj.object_id = instance.pk
+                translations.append(obj)
+
+        return translations
 
 
 @python_2_unicode_compatible
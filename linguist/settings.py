@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
 
 APP_NAMESPACE = 'LINGUIST'
@@ -18,3 +19,46 @@ DEFAULT_LANGUAGE = getattr(
     settings,
     '%s_DEFAULT_LANGUAGE' % APP_NAMESPACE,
     settings.LANGUAGE_CODE)
+
+# Alias of the Django cache (settings.CACHES) used to share translations
+# between processes. Disabled if None.
+CACHE = getattr(
+    settings,
+    '%s_CACHE' % APP_NAMESPACE,
+    None)
+
+CACHE_TIMEOUT = getattr(
+    settings,
+    '%s_CACHE_TIMEOUT' % APP_NAMESPACE,
+    DEFAULT_TIMEOUT)
+
+# Number of threads fetching translations chunks concurrently
+# (``chunks_length`` prefetch option). Chunks are fetched one after another
+# if None.
+PREFETCH_WORKERS = getattr(
+    settings,
+    '%s_PREFETCH_WORKERS' % APP_NAMESPACE,
+    None)
+
+# Fallback languages by language code, tried in order before the default
+# language, e.g. {'pt-br': ['pt', 'es']}. Region-specific languages fall
+# back to their generic language by default.
+FALLBACKS = getattr(
+    settings,
+    '%s_FALLBACKS' % APP_NAMESPACE,
+    {})
+
+# Prefetch translations in the active and fallback languages only (unless
+# languages are explicitly given). Other languages are loaded on access.
+PREFETCH_ACTIVE_LANGUAGES = getattr(
+    settings,
+    '%s_PREFETCH_ACTIVE_LANGUAGES' % APP_NAMESPACE,
+    False)
+
+# Filter on non-localized field names ("title") with the value in the active
+# language, falling back to the default language one (COALESCE), instead of
+# the default language value only.
+FALLBACK_LOOKUPS = getattr(
+    settings,
+    '%s_FALLBACK_LOOKUPS' % APP_NAMESPACE,
+    False)
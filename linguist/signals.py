@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from .cache import invalidate_cached_translations
 from .mixins import ModelMixin
+from .models.base import Translation as BaseTranslation
 
 
 @receiver(post_delete)
@@ -13,3 +15,16 @@ def delete_translations(sender, instance, **kwargs):
     if issubclass(sender, (ModelMixin, )):
         instance._linguist.decider.objects.filter(identifier=instance.linguist_identifier,
                                                   object_id=instance.pk).delete()
+        invalidate_cached_translations(instance._linguist.decider,
+                                       [(instance.linguist_identifier, instance.pk)])
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_translation(sender, instance, **kwargs):
+    """
+    Invalidates cached translations of the related instance when a translation
+    is saved or deleted directly (from the admin, for example).
+    """
+    if issubclass(sender, (BaseTranslation, )):
+        invalidate_cached_translations(sender, [(instance.identifier, instance.object_id)])
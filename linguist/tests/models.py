@@ -202,6 +202,14 @@ class CustomTranslationModel(Translation):
         abstract = False
 
 
+class TimestampedTranslationModel(Translation):
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta(Translation.Meta):
+        abstract = False
+        app_label = 'tests'
+
+
 class DeciderModel(six.with_metaclass(LinguistMeta, models.Model)):
     """
     Example of a model using decider feature.
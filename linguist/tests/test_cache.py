@@ -1,9 +1,22 @@
 # -*- coding: utf-8 -*-
-from ..cache import CachedTranslation
+from django.core.cache import caches
+
+from exam.decorators import before, after
+
+from .. import settings
+from ..cache import (
+    CachedTranslation,
+    TranslationIndex,
+    activate_identity_map,
+    get_identity_map,
+    identity_map,
+)
+from ..helpers import prefetch_translations
+from ..middleware import IdentityMapMiddleware
 from ..models import Translation
 
 from .base import BaseTestCase
-from .models import FooModel
+from .models import Author, FooModel
 
 
 class CachedTranslationTest(BaseTestCase):
@@ -25,6 +38,10 @@ class CachedTranslationTest(BaseTestCase):
         for attr in ('instance', 'translation'):
             self.assertIsNone(getattr(obj, attr))
 
+        # Slotted: no per-instance dictionary
+        self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertRaises(AttributeError, setattr, obj, 'foo', 'bar')
+
     def test_instance_and_translation(self):
         self.instance.activate_language('en')
         self.instance.title = 'Hello'
@@ -55,3 +72,240 @@ class CachedTranslationTest(BaseTestCase):
         self.assertEqual(obj.language, translation.language)
         self.assertEqual(obj.field_name, translation.field_name)
         self.assertEqual(obj.field_value, translation.field_value)
+
+
+class TranslationStoreTest(BaseTestCase):
+    """
+    Tests TranslationStore class.
+    """
+    def test_store(self):
+        index = FooModel._linguist.index
+        self.assertEqual(index.size, len(FooModel._linguist.fields) * len(settings.SUPPORTED_LANGUAGES))
+
+        store = self.instance._linguist.translations
+        self.assertEqual(len(store.slots), index.size)
+        self.assertEqual(len(store), 0)
+
+        self.instance.title_fr = 'Bonjour'
+        self.instance.title_en = 'Hello'
+        self.assertEqual(self.instance.cached_translations_count, 2)
+        self.assertEqual(len(self.instance._linguist.dirty_translation_instances), 2)
+        self.assertEqual(store['title']['fr'].field_value, 'Bonjour')
+        self.assertEqual(store.get('title', 'en').field_value, 'Hello')
+
+        self.instance.save()
+        self.assertEqual(self.instance._linguist.dirty_translation_instances, [])
+
+        self.instance.title_fr = 'Salut'
+        dirty = self.instance._linguist.dirty_translation_instances
+        self.assertEqual([obj.field_value for obj in dirty], ['Salut'])
+
+        # Underscored language codes share the slot of the hyphenated one
+        index = TranslationIndex(['title'], ['en', 'pt-br'])
+        self.assertEqual(index.positions[('title', 'pt_br')], index.positions[('title', 'pt-br')])
+
+        # Languages out of the index are kept aside
+        store.set('title', 'xx', CachedTranslation(field_name='title', language='xx'))
+        self.assertEqual(self.instance.cached_translations_count, 3)
+        self.assertIsNotNone(store.get('title', 'xx'))
+
+        self.instance.clear_translations_cache()
+        self.assertEqual(len(store), 0)
+
+    def test_lazy_missing_translations(self):
+        instance = FooModel.objects.create(title_en='Hello')
+        instance = FooModel.objects.with_translations().get(pk=instance.pk)
+        store = instance._linguist.translations
+
+        # Missing translations are not allocated...
+        self.assertTrue(store.complete)
+        self.assertEqual(store.count, 1)
+        self.assertEqual(instance.cached_translations_count, store.index.size)
+
+        # ... until read
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.title_fr, '')
+        self.assertEqual(store.count, 2)
+
+        instance.title_de = 'Hallo'
+        instance.save()
+        self.assertEqual(FooModel.objects.with_translations().get(pk=instance.pk).title_de, 'Hallo')
+
+        # Partially known: filled and known missing slots are counted once
+        instance = FooModel()
+        store = instance._linguist.translations
+        store.mark_missing(field_names=['title'])
+        instance.title_fr = 'Bonjour'
+        instance.body_it = 'Corpo'
+        self.assertFalse(store.complete)
+        self.assertEqual(len(store), len(settings.SUPPORTED_LANGUAGES) + 1)
+        self.assertEqual(len(store), len(store.keys()))
+
+
+class SharedCacheTest(BaseTestCase):
+    """
+    Tests translations shared cache.
+    """
+
+    @before
+    def enable_shared_cache(self):
+        settings.CACHE = 'default'
+        caches['default'].clear()
+
+    @after
+    def disable_shared_cache(self):
+        settings.CACHE = None
+        caches['default'].clear()
+
+    def test_with_translations(self):
+        for i in range(5):
+            FooModel.objects.create(title_en='Title %d' % i, title_fr='Titre %d' % i)
+
+        # 1 - SELECT ALL foomodel
+        # 2 - SELECT IN translation (then cached)
+        with self.assertNumQueries(2):
+            FooModel.objects.with_translations()
+
+        # Translations now come from the shared cache
+        with self.assertNumQueries(1):
+            instances = FooModel.objects.order_by('pk').with_translations()
+
+        instances = list(instances)
+
+        with self.assertNumQueries(0):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.title_en, 'Title %d' % i)
+                self.assertEqual(instance.title_fr, 'Titre %d' % i)
+                self.assertEqual(instance.title_it, '')
+
+        # Filters are applied on cached translations
+        with self.assertNumQueries(1):
+            qs = FooModel.objects.filter(pk=instances[0].pk).with_translations(languages=['fr'])
+
+        instance = list(qs)[0]
+        self.assertEqual(instance._linguist.translations['title']['fr'].field_value, 'Titre 0')
+        self.assertIsNone(instance._linguist.translations['title']['en'].field_value)
+
+    def test_with_translations_chunks(self):
+        for i in range(5):
+            FooModel.objects.create(title_en='Title %d' % i)
+
+        # 1 - SELECT ALL foomodel
+        # 2 - SELECT IN translation (chunk 1)
+        # 3 - SELECT IN translation (chunk 2)
+        # 4 - SELECT IN translation (chunk 3)
+        with self.assertNumQueries(4):
+            instances = FooModel.objects.order_by('pk').with_translations(chunks_length=2, using='default')
+
+        for i, instance in enumerate(instances):
+            self.assertEqual(instance.title_en, 'Title %d' % i)
+
+    def test_lazy_loading(self):
+        instance = FooModel.objects.create(title_en='Hello', title_fr='Bonjour')
+        instance.clear_translations_cache()
+
+        # All translations of the instance are loaded (and cached) at once
+        with self.assertNumQueries(1):
+            self.assertEqual(instance.title_en, 'Hello')
+            self.assertEqual(instance.title_fr, 'Bonjour')
+            self.assertEqual(instance.title_it, '')
+
+        instance.clear_translations_cache()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.title_fr, 'Bonjour')
+
+    def test_invalidation(self):
+        instance = FooModel.objects.create(title_en='Hello', title_fr='Bonjour')
+        list(FooModel.objects.with_translations())
+
+        # save_translations()
+        instance.title_fr = 'Salut'
+        instance.save()
+        self.assertEqual(FooModel.objects.with_translations().get().title_fr, 'Salut')
+
+        # delete_translations()
+        instance.delete_translations(language='fr')
+        self.assertEqual(FooModel.objects.with_translations().get().title_fr, '')
+
+        # Translations saved or deleted directly
+        translation = Translation.objects.get(identifier=instance.linguist_identifier,
+                                              object_id=instance.pk, language='en')
+        translation.field_value = 'Hi'
+        translation.save()
+        self.assertEqual(FooModel.objects.with_translations().get().title_en, 'Hi')
+
+        translation.delete()
+        self.assertEqual(FooModel.objects.with_translations().get().title_en, '')
+
+        # post_delete
+        pk = instance.pk
+        instance.delete()
+        instance = FooModel.objects.create(pk=pk)
+        self.assertEqual(FooModel.objects.with_translations().get().title_en, '')
+
+
+class IdentityMapTest(BaseTestCase):
+    """
+    Tests translations identity map.
+    """
+
+    def test_identity_map(self):
+        author = self.author
+        articles = self.articles
+
+        with identity_map():
+            # 1 - SELECT author translations
+            with self.assertNumQueries(1):
+                prefetch_translations([author])
+
+            # Other copies of the same object don't hit the database
+            with self.assertNumQueries(0):
+                for article in articles:
+                    article.author.clear_translations_cache()
+                    self.assertEqual(article.author.bio_fr, 'Je suis John Doe')
+
+            # 1 - SELECT ALL author
+            with self.assertNumQueries(1):
+                for obj in Author.objects.all():
+                    self.assertEqual(obj.bio_en, 'I am John Doe')
+
+            # Saved translations are invalidated
+            author.bio_fr = 'Je suis Jean'
+            author.save()
+            with self.assertNumQueries(2):
+                self.assertEqual(Author.objects.get().bio_fr, 'Je suis Jean')
+
+        # Map is emptied when leaving the block
+        author.clear_translations_cache()
+        with self.assertNumQueries(1):
+            self.assertEqual(author.bio_fr, 'Je suis Jean')
+
+    def test_middleware(self):
+        author = self.author
+        middleware = IdentityMapMiddleware(lambda request: get_identity_map())
+
+        self.assertEqual(middleware(None), {})
+        self.assertIsNone(get_identity_map())
+
+        # Django < 1.10
+        middleware.process_request(None)
+        # 3 x SELECT author + 1 x SELECT author translations
+        with self.assertNumQueries(4):
+            for i in range(3):
+                self.assertEqual(Author.objects.get(pk=author.pk).bio_fr, 'Je suis John Doe')
+        middleware.process_response(None, None)
+        self.assertIsNone(get_identity_map())
+
+        # A map left by a previous request is not reused
+        stale_map = {'stale': 'translations'}
+        activate_identity_map()
+        get_identity_map().update(stale_map)
+        self.assertEqual(middleware(None), {})
+        self.assertIsNone(get_identity_map())
+
+        activate_identity_map()
+        get_identity_map().update(stale_map)
+        middleware.process_request(None)
+        self.assertEqual(get_identity_map(), {})
+        middleware.process_response(None, None)
@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 
 import threading
 
+from .. import utils
 from ..models import Translation
 
 from .base import BaseTransactionTestCase
@@ -55,3 +56,12 @@ class ConcurrentTest(BaseTransactionTestCase):
         create_translations(instance)
 
         self.assertTrue(Translation.objects.count() <= 5)
+
+    def test_concurrent_chunks(self):
+        articles = self.articles
+
+        grouped_translations = utils.get_grouped_translations(articles, chunks_length=3, chunks_workers=2)
+
+        self.assertEqual(sorted(grouped_translations.keys()), sorted(article.pk for article in articles))
+        for article in articles:
+            self.assertEqual(len(grouped_translations[article.pk]), 4)
@@ -2,15 +2,18 @@
 from __future__ import unicode_literals
 
 import datetime
+import pickle
 
 from django.core.exceptions import FieldError
-from django.db.models import Q
+from django.db import connection
+from django.db.models import Count, F, Max, Q
+from django.test import skipUnlessDBFeature
 from django.utils import translation
 
 from ..models import Translation
 
 from .base import BaseTestCase
-from .models import FooModel, Article
+from .models import FooModel, Article, DeciderModel
 
 
 class ManagerMixinTest(BaseTestCase):
@@ -34,10 +37,8 @@ class ManagerMixinTest(BaseTestCase):
         # Persist!
         #
         # 1 - INSERT INTO foomodel
-        # 2 - SAVEPOINT
-        # 3 - INSERT INTO translation
-        # 4 - RELEASE SAVEPOINT
-        with self.assertNumQueries(4):
+        # 2 - INSERT INTO translation ... ON CONFLICT DO UPDATE
+        with self.assertNumQueries(2):
             self.instance.save()
 
         # Titles are now cached
@@ -117,10 +118,8 @@ class ManagerMixinTest(BaseTestCase):
         # Persist!
         #
         # 1 - INSERT INTO foomodel
-        # 2 - SAVEPOINT
-        # 3 - INSERT INTO translation
-        # 4 - RELEASE SAVEPOINT
-        with self.assertNumQueries(4):
+        # 2 - INSERT INTO translation ... ON CONFLICT DO UPDATE
+        with self.assertNumQueries(2):
             self.instance.save()
 
         # Preload translations without clearing the cache
@@ -230,6 +229,266 @@ class ManagerMixinTest(BaseTestCase):
         self.assertTrue(self.instance._linguist.translations['title']['fr'])
         self.assertTrue(self.instance._linguist.translations['title']['en'])
 
+    def test_with_translations_stream(self):
+        for i in range(5):
+            FooModel.objects.create(title_en='Title %d' % i, title_fr='Titre %d' % i)
+
+        # Lazy: nothing is fetched yet
+        with self.assertNumQueries(0):
+            qs = FooModel.objects.order_by('pk').with_translations(stream=True, batch_size=2)
+
+        # 1 - SELECT ALL foomodel
+        # 2 - SELECT IN translation (instances 1 and 2)
+        # 3 - SELECT IN translation (instances 3 and 4)
+        # 4 - SELECT IN translation (instance 5)
+        with self.assertNumQueries(4):
+            instances = list(qs.iterator())
+
+        with self.assertNumQueries(0):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.title_en, 'Title %d' % i)
+                self.assertEqual(instance.title_fr, 'Titre %d' % i)
+                self.assertEqual(instance.title_it, '')
+
+        # Prefetch options apply to each batch
+        qs = FooModel.objects.order_by('pk').with_translations(stream=True, languages=['fr'])
+        instance = next(qs.iterator())
+        self.assertEqual(instance._linguist.translations['title']['fr'].field_value, 'Titre 0')
+        self.assertIsNone(instance._linguist.translations['title']['en'].field_value)
+
+    def test_with_translations_relations(self):
+        articles = self.articles
+
+        # 1 - SELECT ALL article
+        # 2 - SELECT IN translation
+        with self.assertNumQueries(2):
+            qs = Article.objects.with_translations('author', 'tags')
+
+        # 1 - SELECT ALL article
+        # 2 - SELECT IN author
+        # 3 - SELECT IN tag
+        # 4 - SELECT IN translation (authors and tags, same decider)
+        with self.assertNumQueries(4):
+            instances = list(qs)
+
+        self.assertEqual(len(instances), len(articles))
+
+        with self.assertNumQueries(0):
+            for article in instances:
+                self.assertEqual(article.title_fr, '%s in FR' % article.slug.split('-')[1])
+                self.assertEqual(article.author.bio_fr, 'Je suis John Doe')
+                self.assertEqual(article.author.bio_it, '')
+                for tag in article.tags.all():
+                    self.assertEqual(tag.name_fr, 'tag fr')
+
+        # 1 - SELECT ALL article
+        # 2 - SELECT IN author
+        # 3 - SELECT IN tag
+        # 4 - SELECT IN translation (authors and tags)
+        with self.assertNumQueries(4):
+            instances = list(qs.iterator())
+
+        with self.assertNumQueries(0):
+            for article in instances:
+                self.assertEqual(article.title_fr, '%s in FR' % article.slug.split('-')[1])
+                self.assertEqual(article.author.bio_fr, 'Je suis John Doe')
+                for tag in article.tags.all():
+                    self.assertEqual(tag.name_fr, 'tag fr')
+
+        # Streamed: related translations are loaded with each batch
+        #
+        # 1 - SELECT ALL article, author (select_related)
+        # 2 - SELECT IN translation (articles)
+        # 3 - SELECT IN tag
+        # 4 - SELECT IN translation (authors and tags)
+        qs = Article.objects.select_related('author').with_translations('author', 'tags', stream=True)
+        with self.assertNumQueries(4):
+            instances = list(qs.iterator())
+
+        with self.assertNumQueries(0):
+            for article in instances:
+                self.assertEqual(article.author.bio_en, 'I am John Doe')
+                for tag in article.tags.all():
+                    self.assertEqual(tag.name_en, 'tag en')
+
+    def test_with_translations_active_languages(self):
+        FooModel.objects.create(title_en='Hello', title_fr='Bonjour', title_de='Hallo', body_fr='Corps')
+
+        translation.activate('fr')
+
+        # 1 - SELECT ALL foomodel
+        # 2 - SELECT IN translation (fr and en only)
+        with self.assertNumQueries(2):
+            instances = FooModel.objects.with_translations(active_languages=True)
+
+        instance = instances[0]
+        self.assertEqual(instance._linguist.translations.count, 3)
+
+        # Active and fallback languages are cached, missing ones included
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.title, 'Bonjour')
+            self.assertEqual(instance.title_en, 'Hello')
+            self.assertEqual(instance.body, 'Corps')
+            self.assertEqual(instance.excerpt_fr, '')
+
+        # Other languages are loaded on access
+        with self.assertNumQueries(1):
+            self.assertEqual(instance.title_de, 'Hallo')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.title_de, 'Hallo')
+
+        translation.activate('en')
+
+    def test_only_defer(self):
+        for i in range(3):
+            FooModel.objects.create(title_en='Title %d' % i, body_en='Body %d' % i, position=i)
+
+        # 1 - SELECT foomodel (id, position)
+        with self.assertNumQueries(1):
+            instances = list(FooModel.objects.only('title', 'position').order_by('position'))
+
+        # 1 - SELECT IN translation (title)
+        with self.assertNumQueries(1):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.title_en, 'Title %d' % i)
+                self.assertEqual(instance.title_fr, '')
+                self.assertEqual(instance.position, i)
+
+        # 1 - SELECT IN translation (excerpt and body)
+        with self.assertNumQueries(1):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.body_en, 'Body %d' % i)
+                self.assertEqual(instance.excerpt_en, '')
+
+        # with_translations() is scoped as well
+        #
+        # 1 - SELECT ALL foomodel
+        # 2 - SELECT IN translation (title)
+        with self.assertNumQueries(2):
+            qs = FooModel.objects.defer('body_fr', 'excerpt').order_by('position').with_translations()
+
+        # 1 - SELECT ALL foomodel
+        with self.assertNumQueries(1):
+            instances = list(qs)
+
+        with self.assertNumQueries(0):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.title_en, 'Title %d' % i)
+
+        # 1 - SELECT IN translation (excerpt and body)
+        with self.assertNumQueries(1):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.body_en, 'Body %d' % i)
+
+        # Deferred concrete fields
+        #
+        # 1 - SELECT ALL foomodel (id)
+        # 2 - SELECT IN translation (title)
+        with self.assertNumQueries(2):
+            qs = FooModel.objects.only('title').order_by('position').with_translations()
+
+        instances = list(qs)
+
+        with self.assertNumQueries(0):
+            self.assertEqual([instance.title_en for instance in instances], ['Title 0', 'Title 1', 'Title 2'])
+
+        # 1 - SELECT ALL foomodel (without position)
+        # 2 - SELECT IN translation
+        with self.assertNumQueries(2):
+            qs = FooModel.objects.defer('position').order_by('pk').with_translations()
+
+        instances = list(qs)
+
+        with self.assertNumQueries(0):
+            self.assertEqual([instance.body_en for instance in instances], ['Body 0', 'Body 1', 'Body 2'])
+
+        # defer(None) clears deferred translations
+        qs = FooModel.objects.only('title').defer(None)
+        self.assertIsNone(qs._translated_field_names)
+
+    def test_values(self):
+        first = FooModel.objects.create(title_en='Hello', title_fr='Bonjour', position=1)
+        second = FooModel.objects.create(title_en='Hi', position=2)
+
+        translation.activate('fr')
+
+        # 1 - SELECT foomodel with translations subqueries
+        with self.assertNumQueries(1):
+            rows = list(FooModel.objects.order_by('position').values('id', 'title', 'title_fr', 'title_en'))
+
+        self.assertEqual(rows, [
+            {'id': first.pk, 'title': 'Bonjour', 'title_fr': 'Bonjour', 'title_en': 'Hello'},
+            # Localized fields don't fall back on default language
+            {'id': second.pk, 'title': 'Hi', 'title_fr': None, 'title_en': 'Hi'},
+        ])
+
+        with self.assertNumQueries(1):
+            rows = list(FooModel.objects.order_by('position').values_list('position', 'title'))
+
+        self.assertEqual(rows, [(1, 'Bonjour'), (2, 'Hi')])
+
+        titles = FooModel.objects.filter(title_en='Hi').values_list('title_en', flat=True)
+        self.assertEqual(list(titles), ['Hi'])
+
+        # Missing (NULL) and empty values
+        third = FooModel.objects.create(title_en='Hey', position=3)
+        Translation.objects.create(identifier=third.linguist_identifier, object_id=third.pk,
+                                   language='fr', field_name='title', field_value='')
+        titles = FooModel.objects.order_by('position').values_list('title_fr', flat=True)
+        self.assertEqual(list(titles), ['Bonjour', None, ''])
+
+        translation.activate('en')
+
+    def test_annotate_aggregate(self):
+        FooModel.objects.create(title_en='Hello', title_fr='Bonjour', position=1)
+        FooModel.objects.create(title_en='Hello', title_fr='Salut', position=2)
+        FooModel.objects.create(title_en='Hi', position=3)
+
+        # GROUP BY translated value
+        with self.assertNumQueries(1):
+            rows = list(FooModel.objects.values('title_en').annotate(n=Count('id')).order_by('title_en'))
+
+        self.assertEqual(rows, [{'title_en': 'Hello', 'n': 2}, {'title_en': 'Hi', 'n': 1}])
+
+        translation.activate('fr')
+
+        with self.assertNumQueries(1):
+            result = FooModel.objects.aggregate(Count('title_fr', distinct=True), last=Max('title'))
+
+        self.assertEqual(result, {'title_fr__count': 2, 'last': 'Salut'})
+
+        # Bare field names fall back on default language
+        with self.assertNumQueries(1):
+            instances = list(FooModel.objects.annotate(localized=F('title')).order_by('position'))
+
+        self.assertEqual([instance.localized for instance in instances], ['Bonjour', 'Salut', 'Hi'])
+
+        translation.activate('en')
+
+        with self.assertNumQueries(1):
+            titles = list(FooModel.objects.values_list('title_en', flat=True).distinct().order_by('title_en'))
+
+        self.assertEqual(titles, ['Hello', 'Hi'])
+
+    @skipUnlessDBFeature('can_distinct_on_fields')
+    def test_distinct_on(self):
+        FooModel.objects.create(title_en='Hello', title_fr='Bonjour', position=1)
+        FooModel.objects.create(title_en='Hello', title_fr='Bonjour', position=2)
+        FooModel.objects.create(title_en='Hi', position=3)
+
+        translation.activate('fr')
+
+        # DISTINCT ON the values ORDER BY sorts on (French, then English)
+        instances = list(FooModel.objects.order_by('title', 'position').distinct('title'))
+        self.assertEqual([instance.position for instance in instances], [1, 3])
+        self.assertEqual([instance.title for instance in instances], ['Bonjour', 'Hi'])
+
+        instances = list(FooModel.objects.order_by('title_fr', 'position').distinct('title_fr'))
+        self.assertEqual([instance.position for instance in instances], [1, 3])
+
+        translation.activate('en')
+
     def test_without_prefetching(self):
         # Create English content
         self.instance.activate_language('en')
@@ -242,10 +501,8 @@ class ManagerMixinTest(BaseTestCase):
         # Persist!
         #
         # 1 - INSERT INTO foomodel
-        # 2 - SAVEPOINT
-        # 3 - INSERT INTO translation
-        # 4 - RELEASE SAVEPOINT
-        with self.assertNumQueries(4):
+        # 2 - INSERT INTO translation ... ON CONFLICT DO UPDATE
+        with self.assertNumQueries(2):
             self.instance.save()
 
         # Clear cache
@@ -322,9 +579,13 @@ class ManagerMixinTest(BaseTestCase):
         translation.activate('en')
         self.assertEqual(translation.get_language(), 'en')
 
-        # Without prefetch
+        # Without prefetch, translations of the whole result set are loaded
+        # on first access.
+        #
+        # 1 - SELECT ALL foomodel
+        # 2 - SELECT IN translation
         qs = FooModel.objects.all()
-        with self.assertNumQueries(121):
+        with self.assertNumQueries(2):
             for language in self.languages:
                 translation.activate(language)
                 for obj in qs:
@@ -386,3 +647,297 @@ class ManagerMixinTest(BaseTestCase):
         # Multiple Q parameters
         now = datetime.datetime.now()
         self.assertEqual(FooModel.objects.filter(Q(is_published=True, position=1) | Q(is_published=True, position=2)).count(), 1)
+
+    def test_lookup_subquery(self):
+        for i in range(5):
+            m = FooModel()
+            m.activate_language('en')
+            m.title = 'Title %d in en' % i
+            m.is_published = bool(i % 2)
+            m.save()
+
+        # Filtering is lazy: no query until the queryset is evaluated.
+        with self.assertNumQueries(0):
+            qs = FooModel.objects.filter(title_en__startswith='Title').filter(is_published=True)
+
+        # Translations are looked up in a subquery of the same statement.
+        with self.assertNumQueries(1):
+            self.assertEqual(len(qs), 2)
+
+        self.assertEqual(FooModel.objects.filter(title_en__startswith='Nothing', is_published=True).count(), 0)
+        self.assertEqual(FooModel.objects.exclude(title_en='Title 0 in en').count(), 4)
+
+        # Each linguist lookup matches its own translation
+        FooModel.objects.create(title_en='Apple', body_en='Fruit', title_fr='Pomme')
+        self.assertEqual(FooModel.objects.filter(title_en='Apple', body_en='Fruit').count(), 1)
+        self.assertEqual(FooModel.objects.filter(title_en='Apple', body_en='Vegetable').count(), 0)
+        self.assertEqual(FooModel.objects.filter(title_en='Apple', title_fr='Pomme').count(), 1)
+        self.assertEqual(FooModel.objects.filter(Q(title_en='Apple'), Q(title_fr='Poire')).count(), 0)
+        self.assertEqual(FooModel.objects.exclude(title_en='Apple', body_en='Vegetable').count(), 6)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(len(FooModel.objects.filter(title_en='Apple', body_en='Fruit')), 1)
+
+    def test_lookup_parser(self):
+        # Shared by all querysets of the model
+        lookups = FooModel.objects.all().linguist_lookups
+        self.assertIs(FooModel.objects.filter(position=1).linguist_lookups, lookups)
+        self.assertIs(FooModel._linguist.lookups, lookups)
+
+        self.assertEqual(lookups.parse('title'), ('title', None, ''))
+        self.assertEqual(lookups.parse('title_fr__icontains'), ('title', 'fr', 'icontains'))
+        self.assertEqual(lookups.parse('excerpt_pt__in'), ('excerpt', 'pt', 'in'))
+        self.assertIsNone(lookups.parse('position__gte'))
+        self.assertIsNone(lookups.parse('title_ru'))
+
+        self.assertEqual(lookups.get_translation_lookup('foo', 'title__startswith', 'H'), {
+            'field_name': 'title',
+            'identifier': 'foo',
+            'language': 'en',
+            'field_value__startswith': 'H',
+        })
+
+        cleaned, translation_lookups = lookups.split('foo', {'position': 1, 'title_fr': 'Bonjour'})
+        self.assertEqual(cleaned, {'position': 1})
+        self.assertEqual(translation_lookups, [{
+            'field_name': 'title',
+            'identifier': 'foo',
+            'language': 'fr',
+            'field_value': 'Bonjour',
+        }])
+
+    def test_lookup_decider(self):
+        m = DeciderModel()
+        m.activate_language('en')
+        m.title = 'Hello'
+        m.save()
+
+        self.assertEqual(Translation.objects.count(), 0)
+        self.assertEqual(DeciderModel.objects.filter(title_en='Hello').count(), 1)
+        self.assertEqual(DeciderModel.objects.filter(title_en='Hi').count(), 0)
+
+    def test_with_translated_columns(self):
+        for i in range(5):
+            m = FooModel()
+            m.activate_language('en')
+            m.title = 'Title %d in en' % i
+            m.activate_language('fr')
+            m.title = 'Title %d in fr' % i
+            m.save()
+
+        translation.activate('en')
+
+        # Translations are selected with model rows: one query only.
+        with self.assertNumQueries(1):
+            instances = list(FooModel.objects.with_translated_columns('title', languages=('en', 'fr')).order_by('pk'))
+
+        with self.assertNumQueries(0):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.title_en, 'Title %d in en' % i)
+                self.assertEqual(instance.title_fr, 'Title %d in fr' % i)
+                self.assertEqual(instance.title, 'Title %d in en' % i)
+                self.assertFalse(hasattr(instance, '_linguist_title_en'))
+
+        # Missing translations are cached as empty values.
+        with self.assertNumQueries(1):
+            instance = FooModel.objects.with_translated_columns('title', language='it').first()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.title_it, '')
+
+        # Cached values behave like prefetched ones on save.
+        instance.title_it = 'Title in it'
+        instance.title_fr = 'Titre'
+        instance.save()
+
+        self.assertEqual(FooModel.objects.filter(title_it='Title in it').count(), 1)
+        self.assertEqual(FooModel.objects.filter(title_fr='Titre').count(), 1)
+
+        self.assertRaises(FieldError, FooModel.objects.with_translated_columns, 'is_published')
+
+    def test_with_fallback(self):
+        FooModel.objects.create(title_en='Hello', title_fr='Bonjour', position=1)
+        FooModel.objects.create(title_en='Hi', position=2)
+
+        translation.activate('fr')
+
+        # Default language value only
+        self.assertEqual(FooModel.objects.filter(title='Hello').count(), 1)
+        self.assertEqual(FooModel.objects.filter(title='Bonjour').count(), 0)
+
+        # Active language value, falling back to default language one
+        qs = FooModel.objects.with_fallback()
+        self.assertEqual(qs.filter(title='Hello').count(), 0)
+        self.assertEqual(qs.filter(title='Bonjour').count(), 1)
+        self.assertEqual(qs.filter(Q(title__startswith='B') | Q(title='Hi')).count(), 2)
+        self.assertEqual(qs.exclude(title='Hi').count(), 1)
+        self.assertEqual(qs.with_fallback(enabled=False).filter(title='Hello').count(), 1)
+
+        # Fallback values are only computed in WHERE
+        self.assertEqual(str(qs.filter(title='Hi').query).count('COALESCE'), 1)
+
+        # Internal annotations are not selected by values()
+        row = qs.filter(title='Hi').values().get()
+        self.assertEqual(row['position'], 2)
+        self.assertFalse([key for key in row if key.startswith('_linguist_')])
+        self.assertEqual(len(qs.filter(title='Hi').values_list().get()), len(FooModel._meta.concrete_fields))
+
+        # Filtered and selected in a single query
+        with self.assertNumQueries(1):
+            instances = list(FooModel.objects.with_fallback('title').filter(title__in=['Bonjour', 'Hi']).order_by('position'))
+
+        with self.assertNumQueries(0):
+            self.assertEqual([instance.title for instance in instances], ['Bonjour', 'Hi'])
+            self.assertFalse(hasattr(instances[0], '_linguist_fallback_title'))
+
+        translation.activate('en')
+
+    def test_order_by(self):
+        titles = (
+            ('b', 'y'),
+            ('c', None),
+            ('a', 'z'),
+            ('d', 'x'),
+        )
+        for title_en, title_fr in titles:
+            m = FooModel(title_en=title_en)
+            if title_fr:
+                m.title_fr = title_fr
+            m.save()
+
+        translation.activate('en')
+
+        def titles_of(qs, language):
+            return [getattr(obj, 'title_%s' % language) or obj.title_en for obj in qs]
+
+        # Ordering is done by the database: one query for a page.
+        with self.assertNumQueries(1):
+            page = list(FooModel.objects.order_by('title')[:2])
+        self.assertEqual([obj.title_en for obj in page], ['a', 'b'])
+
+        self.assertEqual([obj.title_en for obj in FooModel.objects.order_by('-title_en')], ['d', 'c', 'b', 'a'])
+
+        # Missing translations fall back to the default language.
+        self.assertEqual(titles_of(FooModel.objects.order_by('title_fr'), 'fr'), ['c', 'x', 'y', 'z'])
+        self.assertEqual(titles_of(FooModel.objects.order_by('-title_fr'), 'fr'), ['z', 'y', 'x', 'c'])
+
+        # Bare field name uses the active language.
+        translation.activate('fr')
+        self.assertEqual(titles_of(FooModel.objects.order_by('title'), 'fr'), ['c', 'x', 'y', 'z'])
+        translation.activate('en')
+
+        # Concrete fields are left untouched.
+        self.assertEqual(list(FooModel.objects.order_by('title_fr', '-pk').values_list('pk', flat=True)),
+                         list(FooModel.objects.order_by('title_fr').values_list('pk', flat=True)))
+        self.assertEqual(FooModel.objects.order_by('-pk').first().title_en, 'd')
+
+    def test_prefetch_on_first_access(self):
+        for i in range(10):
+            m = FooModel()
+            m.activate_language('en')
+            m.title = 'Title %d in en' % i
+            m.activate_language('fr')
+            m.title = 'Title %d in fr' % i
+            m.save()
+
+        translation.activate('en')
+
+        instances = list(FooModel.objects.order_by('pk'))
+
+        # First miss loads translations of all instances
+        with self.assertNumQueries(1):
+            self.assertEqual(instances[0].title_fr, 'Title 0 in fr')
+
+        with self.assertNumQueries(0):
+            for i, instance in enumerate(instances):
+                self.assertEqual(instance.title_en, 'Title %d in en' % i)
+                self.assertEqual(instance.title_fr, 'Title %d in fr' % i)
+                self.assertEqual(instance.body_it, '')
+
+        # Values set before loading are kept
+        instances = list(FooModel.objects.with_translated_columns('title', languages='en').order_by('pk'))
+        instances[0].title_en = 'Changed'
+        with self.assertNumQueries(1):
+            self.assertEqual(instances[1].title_fr, 'Title 1 in fr')
+        self.assertEqual(instances[0].title_en, 'Changed')
+
+        # iterator() doesn't keep instances alive: translations are loaded
+        # by batch when streamed (see test_with_translations_stream).
+        #
+        # 1 - SELECT ALL foomodel
+        # 2 - SELECT IN translation (5 first instances)
+        # 3 - SELECT IN translation (5 last instances)
+        with self.assertNumQueries(3):
+            for instance in FooModel.objects.with_translations(stream=True, batch_size=5).iterator():
+                self.assertTrue(instance.title_fr)
+                self.assertFalse(hasattr(instance, '_linguist_siblings'))
+
+        # Instances loaded along with an instance are not pickled with it
+        instances = list(FooModel.objects.order_by('pk'))
+        instance = pickle.loads(pickle.dumps(instances[0]))
+        self.assertFalse(hasattr(instance, '_linguist_siblings'))
+        self.assertEqual(instance.title_fr, 'Title 0 in fr')
+
+    def test_bulk_create(self):
+        objs = [FooModel(pk=i + 1, title_en='Title %d' % i, title_fr='Titre %d' % i) for i in range(10)]
+
+        # 1 - INSERT INTO foomodel
+        # 2 - INSERT INTO translation ... ON CONFLICT DO UPDATE
+        with self.assertNumQueries(2):
+            FooModel.objects.bulk_create(objs)
+
+        self.assertEqual(FooModel.objects.count(), 10)
+        self.assertEqual(Translation.objects.count(), 20)
+        self.assertEqual(FooModel.objects.filter(title_fr='Titre 3').get().pk, 4)
+
+        # Batch size applies to translations as well
+        objs = [FooModel(pk=i + 11, title_en='Title %d' % i, title_fr='Titre %d' % i) for i in range(10)]
+
+        # 1-3 - INSERT INTO foomodel (4, 4 and 2 objects)
+        # 4-8 - INSERT INTO translation ... ON CONFLICT DO UPDATE (5 x 4 translations)
+        with self.assertNumQueries(8):
+            FooModel.objects.bulk_create(objs, batch_size=4)
+
+        self.assertEqual(Translation.objects.count(), 40)
+
+        # Translations can't be bound to objects without primary key
+        self.assertRaises(ValueError, FooModel.objects.bulk_create, [FooModel(title_en='Title')])
+        self.assertEqual(FooModel.objects.count(), 20)
+
+    def test_bulk_update(self):
+        for i in range(10):
+            FooModel.objects.create(title_en='Title %d' % i)
+
+        objs = list(FooModel.objects.with_translations())
+        for obj in objs:
+            obj.position = obj.pk
+            obj.title_en = 'New title %d' % obj.pk
+            obj.title_fr = 'Titre %d' % obj.pk
+
+        # 1 - UPDATE foomodel
+        # 2 - INSERT INTO translation ... ON CONFLICT DO UPDATE
+        with self.assertNumQueries(2):
+            FooModel.objects.bulk_update(objs, fields=['position', 'title'])
+
+        for obj in FooModel.objects.with_translations():
+            self.assertEqual(obj.position, obj.pk)
+            self.assertEqual(obj.title_en, 'New title %d' % obj.pk)
+            self.assertEqual(obj.title_fr, 'Titre %d' % obj.pk)
+
+        self.assertEqual(Translation.objects.count(), 20)
+
+    def test_bulk_update_batches(self):
+        FooModel.objects.bulk_create([FooModel(pk=i + 1) for i in range(400)])
+
+        objs = list(FooModel.objects.all())
+        for obj in objs:
+            obj.position = obj.pk
+            obj.is_published = True
+
+        # Each object binds 5 parameters (999 at most per query on SQLite:
+        # UPDATE foomodel by batches of 199 objects)
+        batch_size = connection.ops.bulk_batch_size(['pk'] * 5, objs)
+        with self.assertNumQueries((len(objs) + batch_size - 1) // batch_size):
+            FooModel.objects.bulk_update(objs, fields=['position', 'is_published'])
+
+        self.assertEqual(FooModel.objects.filter(is_published=True).count(), 400)
@@ -5,6 +5,7 @@ from django.utils import translation
 
 from exam import before
 from .. import settings
+from ..helpers import prefetch_translations
 from ..models import Translation
 
 from .base import BaseTestCase
@@ -14,7 +15,8 @@ from .models import (Article,
                      DefaultLanguageFieldModel,
                      DefaultLanguageFieldModelWithCallable,
                      CustomTranslationModel,
-                     DeciderModel)
+                     DeciderModel,
+                     TimestampedTranslationModel)
 
 
 class ModelMixinTest(BaseTestCase):
@@ -145,7 +147,9 @@ class ModelMixinTest(BaseTestCase):
         instance.title_en = 'Hi'
         instance.title_fr = 'Salut'
 
-        with self.assertNumQueries(3):
+        # 1 - UPDATE foomodel
+        # 2 - INSERT INTO translation ... ON CONFLICT DO UPDATE
+        with self.assertNumQueries(2):
             instance.save()
 
         self.assertEqual(instance.title, 'Hi')
@@ -294,6 +298,31 @@ class ModelMixinTest(BaseTestCase):
 
         translation.activate(saved_lang)
 
+    def test_fallback_chain(self):
+        m = FooModel(title_en='hello', title_es='hola')
+        m.save()
+        m.clear_translations_cache()
+
+        settings.FALLBACKS = {'it': ['pt', 'es']}
+        translation.activate('it')
+
+        # 1 - SELECT title translations in it, pt, es and en
+        with self.assertNumQueries(1):
+            self.assertEqual(m.title, 'hola')
+            self.assertEqual(m.title, 'hola')
+
+        # Prefetched chain resolves without query
+        with self.assertNumQueries(2):
+            instances = FooModel.objects.filter(pk=m.pk).with_translations(active_languages=True)
+
+        instance = instances[0]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(instance.title, 'hola')
+
+        settings.FALLBACKS = {}
+        translation.activate('en')
+
     def test_prefetch_translations(self):
         article = self.articles[0]
 
@@ -383,3 +412,143 @@ class ModelMixinTest(BaseTestCase):
         with self.assertNumQueries(1):
             for language in ('fr', 'en'):
                 title = getattr(article, 'title_%s' % language)
+
+    def test_prefetch_translations_mixed_models(self):
+        articles = self.articles
+        author = self.author
+        tag = self.tag
+        decided = DeciderModel.objects.create(title_fr='Décidé')
+
+        instances = [author, tag, decided] + articles
+        for instance in instances:
+            instance.clear_translations_cache()
+
+        # 1 - SELECT translation (articles, author and tag)
+        # 2 - SELECT custom translation (decider model)
+        with self.assertNumQueries(2):
+            prefetch_translations(instances)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(author.bio_fr, 'Je suis John Doe')
+            self.assertEqual(tag.name_fr, 'tag fr')
+            self.assertEqual(decided.title_fr, 'Décidé')
+            self.assertEqual(decided.title_en, '')
+            for i, article in enumerate(articles):
+                self.assertEqual(article.title_fr, '%d in FR' % i)
+
+        # Prefetch options apply to all models
+        for instance in instances:
+            instance.clear_translations_cache()
+
+        with self.assertNumQueries(2):
+            prefetch_translations(instances, languages=['en'], populate_missing=False)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(author.bio_en, 'I am John Doe')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(author.bio_fr, 'Je suis John Doe')
+
+    def test_missing_translations_cache(self):
+        self.instance.activate_language('en')
+        self.instance.title = 'Hello'
+        self.instance.save()
+        self.instance.clear_translations_cache()
+
+        # A missing translation is only looked up once
+        with self.assertNumQueries(1):
+            self.assertEqual(self.instance.title_it, '')
+            self.assertEqual(self.instance.title_it, '')
+
+        # Cached as missing
+        self.assertEqual(self.instance.cached_translations_count, 1)
+        self.assertEqual(self.instance._linguist.dirty_translation_instances, [])
+
+        # Fallback checks don't hit the database again either
+        translation.activate('it')
+        with self.assertNumQueries(1):
+            self.assertEqual(self.instance.title, 'Hello')
+            self.assertEqual(self.instance.title, 'Hello')
+        translation.activate('en')
+
+        # Setting a value invalidates the miss
+        with self.assertNumQueries(0):
+            self.instance.title_it = 'Ciao'
+            self.assertEqual(self.instance.title_it, 'Ciao')
+
+        self.instance.save()
+        self.assertFalse(self.instance._linguist.translations.is_missing('title', 'it'))
+        self.assertEqual(Translation.objects.filter(language='it').count(), 1)
+
+    def test_save_translations_upsert(self):
+        instances = [FooModel.objects.create() for i in range(20)]
+
+        for i, instance in enumerate(instances):
+            instance.title_en = 'Title %d' % i
+            instance.title_fr = 'Titre %d' % i
+
+        # Translations of all instances are inserted at once
+        with self.assertNumQueries(1):
+            Translation.objects.save_translations(instances)
+
+        self.assertEqual(Translation.objects.count(), 40)
+
+        for i, instance in enumerate(instances):
+            instance.title_fr = 'Nouveau titre %d' % i
+            instance.title_it = 'Titolo %d' % i
+
+        # Updates and inserts are batched together
+        with self.assertNumQueries(1):
+            Translation.objects.save_translations(instances)
+
+        self.assertEqual(Translation.objects.count(), 60)
+        self.assertEqual(Translation.objects.filter(language='fr', field_value__startswith='Nouveau').count(), 20)
+
+        # Nothing changed, nothing to save
+        with self.assertNumQueries(0):
+            Translation.objects.save_translations(instances)
+
+        # Deciders without the unique key fall back to the default path
+        self.assertTrue(Translation.objects.can_upsert())
+        self.assertFalse(CustomTranslationModel.objects.can_upsert())
+
+        # Copies of the same instance: the last value is saved
+        first, second = FooModel.objects.get(pk=instances[0].pk), FooModel.objects.get(pk=instances[0].pk)
+        first.title_de = 'Erster'
+        second.title_de = 'Zweiter'
+        with self.assertNumQueries(1):
+            Translation.objects.save_translations([first, second])
+
+        self.assertEqual(Translation.objects.get(language='de').field_value, 'Zweiter')
+
+    def test_save_translations_extra_fields(self):
+        # Upserts would skip other columns defaults and pre_save()
+        self.assertFalse(TimestampedTranslationModel.objects.can_upsert())
+
+        self.instance.save()
+        self.instance.title_en = 'Hello'
+        TimestampedTranslationModel.objects.save_translations([self.instance])
+
+        self.assertIsNotNone(TimestampedTranslationModel.objects.get().updated_at)
+
+    def test_save_translations_conflict(self):
+        self.instance.save()
+        self.instance.title_en = 'Hello'
+        self.instance.title_fr = 'Bonjour'
+
+        # Another process saved a French title in the meantime
+        Translation.objects.create(identifier='foo',
+                                   object_id=self.instance.pk,
+                                   language='fr',
+                                   field_name='title',
+                                   field_value='Salut')
+
+        Translation.objects.create_or_update_translations([self.instance])
+
+        self.assertEqual(Translation.objects.count(), 2)
+        self.assertEqual(Translation.objects.get(language='en').field_value, 'Hello')
+        self.assertEqual(Translation.objects.get(language='fr').field_value, 'Bonjour')
+
+        # Translations are now saved: nothing to retry
+        with self.assertNumQueries(0):
+            Translation.objects.create_or_update_translations([self.instance])
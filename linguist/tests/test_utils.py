@@ -43,6 +43,18 @@ class UtilsTest(BaseTestCase):
     def test_get_fallback_language(self):
         self.assertEqual(utils.get_fallback_language(), settings.DEFAULT_LANGUAGE)
 
+    def test_get_fallback_languages(self):
+        self.assertEqual(utils.get_fallback_languages('fr'), ['fr', 'en'])
+        self.assertEqual(utils.get_fallback_languages('en'), ['en'])
+        self.assertEqual(utils.get_fallback_languages('fr', 'de'), ['fr', 'de'])
+
+        # Region-specific languages fall back to their generic language
+        self.assertEqual(utils.get_fallback_languages('pt-br'), ['pt', 'en'])
+
+        settings.FALLBACKS = {'it': ['pt', 'ru', 'es']}
+        self.assertEqual(utils.get_fallback_languages('it'), ['it', 'pt', 'es', 'en'])
+        settings.FALLBACKS = {}
+
     def test_get_supported_languages(self):
         languages = [
             ('en-us', 'English'),
@@ -56,6 +68,28 @@ class UtilsTest(BaseTestCase):
 
         settings.SUPPORTED_LANGUAGES = old
 
+    def test_language_tables(self):
+        tables = utils.get_language_tables()
+
+        # Built once, memoized
+        translation.activate('fr-ca')
+        self.assertEqual(utils.get_language(), 'fr')
+        self.assertEqual(tables.resolved['fr-ca'], 'fr')
+        self.assertIs(utils.get_language_tables(), tables)
+        self.assertTrue(utils.is_supported_language('fr'))
+        self.assertFalse(utils.is_supported_language('ru'))
+
+        # Rebuilt when settings change
+        old = settings.SUPPORTED_LANGUAGES
+        settings.SUPPORTED_LANGUAGES = [('fr-ca', 'Canadian French'), ('en', 'English')]
+
+        self.assertEqual(utils.get_language(), 'fr-ca')
+        self.assertEqual(utils.get_language_name('fr-ca'), 'Canadian French')
+        self.assertIsNot(utils.get_language_tables(), tables)
+
+        settings.SUPPORTED_LANGUAGES = old
+        translation.activate('en')
+
     def test_get_language_fields(self):
         self.assertEqual(utils.get_language_fields(['title']), [
             'title_en',
@@ -109,3 +143,27 @@ class UtilsTest(BaseTestCase):
             lookup = utils.get_translation_lookup('foo', k, 'value')
             lookup = json.loads(json.dumps(lookup, sort_keys=True))
             self.assertEqual(lookup, expected[k])
+
+    def test_chunks(self):
+        self.assertEqual(list(utils.chunks([1, 2, 3, 4, 5], 2)), [[1, 2], [3, 4], [5]])
+
+    def test_get_grouped_translations_chunks(self):
+        articles = self.articles
+
+        # 1 - SELECT IN translation (articles 1 to 4)
+        # 2 - SELECT IN translation (articles 5 to 8)
+        # 3 - SELECT IN translation (articles 9 and 10)
+        with self.assertNumQueries(3):
+            grouped_translations = utils.get_grouped_translations(articles, chunks_length=4)
+
+        self.assertEqual(sorted(grouped_translations.keys()), sorted(article.pk for article in articles))
+        for article in articles:
+            self.assertEqual(len(grouped_translations[article.pk]), 4)
+
+        # Within a transaction (test case), chunks are fetched sequentially:
+        # other connections would not see uncommitted translations.
+        with self.assertNumQueries(3):
+            grouped_translations = utils.get_grouped_translations(articles, chunks_length=4, chunks_workers=3)
+
+        for article in articles:
+            self.assertEqual(len(grouped_translations[article.pk]), 4)
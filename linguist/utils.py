@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 import collections
+import functools
+import itertools
+import operator
+
+from multiprocessing.pool import ThreadPool
 
 try:
     # py27 / py3 only
@@ -7,7 +12,8 @@ try:
 except ImportError:
     from django.utils.importlib import import_module
 
-from django.db.models import QuerySet
+from django.db import connections
+from django.db.models import Q, QuerySet
 from django.core import exceptions
 from django.utils import six
 from django.utils.encoding import force_text
@@ -22,9 +28,81 @@ CLASS_PATH_ERROR = 'django-linguist is unable to interpret settings value for %s
                    '(\'path.to.models.Class\', \'app_label\').'
 
 
+class LanguageTables(object):
+    """
+    Lookup tables of supported languages, built once (at app ready time)
+    from ``LINGUIST_SUPPORTED_LANGUAGES``, ``LINGUIST_DEFAULT_LANGUAGE`` and
+    ``LINGUIST_FALLBACKS`` settings. Resolved language codes and fallback
+    chains are memoized.
+    """
+
+    __slots__ = ('sources', 'codes', 'names', 'underscored', 'underscored_codes', 'resolved', 'chains')
+
+    def __init__(self, supported_languages, default_language, fallbacks):
+        self.sources = (supported_languages, default_language, fallbacks)
+        self.codes = frozenset(code for code, name in supported_languages)
+        self.names = dict(supported_languages)
+        self.underscored = tuple(code.replace('-', '_') for code, name in supported_languages)
+        self.underscored_codes = frozenset(self.underscored)
+        self.resolved = {}
+        self.chains = {}
+
+    def is_stale(self):
+        """
+        Returns True if settings have been changed since tables were built.
+        """
+        supported_languages, default_language, fallbacks = self.sources
+        if supported_languages is not settings.SUPPORTED_LANGUAGES or fallbacks is not settings.FALLBACKS:
+            return True
+        return default_language != settings.DEFAULT_LANGUAGE
+
+    def resolve(self, lang):
+        """
+        Returns the supported language code of the given language code: the
+        code itself, its generic language code ("pt" for "pt-br") or the
+        default language.
+        """
+        try:
+            return self.resolved[lang]
+        except KeyError:
+            pass
+
+        code = lang
+        if code not in self.codes and '-' in code:
+            code = code.split('-')[0]
+
+        if code not in self.codes:
+            code = self.sources[1]
+
+        self.resolved[lang] = code
+        return code
+
+
+_language_tables = None
+
+
+def build_language_tables():
+    """
+    (Re)builds supported languages lookup tables.
+    """
+    global _language_tables
+    _language_tables = LanguageTables(settings.SUPPORTED_LANGUAGES, settings.DEFAULT_LANGUAGE, settings.FALLBACKS)
+    return _language_tables
+
+
+def get_language_tables():
+    """
+    Returns supported languages lookup tables, rebuilt if settings have
+    changed.
+    """
+    tables = _language_tables
+    if tables is None or tables.is_stale():
+        tables = build_language_tables()
+    return tables
+
+
 def get_language_name(code):
-    languages = dict((lang_code, lang_name) for lang_code, lang_name in settings.SUPPORTED_LANGUAGES)
-    return languages.get(code)
+    return get_language_tables().names.get(code)
 
 
 def get_language():
@@ -37,14 +115,7 @@ def get_language():
     if not lang:
         return get_fallback_language()
 
-    langs = [l[0] for l in settings.SUPPORTED_LANGUAGES]
-    if lang not in langs and '-' in lang:
-        lang = lang.split('-')[0]
-
-    if lang in langs:
-        return lang
-
-    return settings.DEFAULT_LANGUAGE
+    return get_language_tables().resolve(lang)
 
 
 def get_fallback_language():
@@ -54,6 +125,38 @@ def get_fallback_language():
     return settings.DEFAULT_LANGUAGE
 
 
+def get_fallback_languages(language=None, default_language=None):
+    """
+    Returns the fallback chain of the given language (defaults to the active
+    language): the language itself, its ``LINGUIST_FALLBACKS`` languages
+    (defaults to its generic language, "pt" for "pt-br") and the default
+    language. Only supported languages are kept.
+    """
+    if language is None:
+        language = get_language()
+
+    if default_language is None:
+        default_language = get_fallback_language()
+
+    tables = get_language_tables()
+    key = (language, default_language)
+
+    chain = tables.chains.get(key)
+
+    if chain is None:
+        fallbacks = settings.FALLBACKS.get(language, None)
+        if fallbacks is None:
+            fallbacks = [language.split('-')[0]] if '-' in language else []
+
+        chain = []
+        for lang in itertools.chain([language], fallbacks, [default_language]):
+            if lang in tables.codes and lang not in chain:
+                chain.append(lang)
+        chain = tables.chains[key] = tuple(chain)
+
+    return list(chain)
+
+
 def get_real_field_name(field, lang=None):
     if lang is None:
         lang = get_language()
@@ -68,7 +171,14 @@ def get_supported_languages():
     """
     Returns supported languages list.
     """
-    return [code.replace('-', '_') for code, name in settings.SUPPORTED_LANGUAGES]
+    return list(get_language_tables().underscored)
+
+
+def is_supported_language(code):
+    """
+    Returns True if the given (underscored) language code is supported.
+    """
+    return code in get_language_tables().underscored_codes
 
 
 def get_language_fields(fields):
@@ -76,14 +186,14 @@ def get_language_fields(fields):
     Takes a list of fields and returns related language fields.
     """
     return ['%s_%s' % (field, lang) for field in fields
-                                    for lang in get_supported_languages()]
+                                    for lang in get_language_tables().underscored]
 
 
 def activate_language(instances, language):
     """
     Activates the given language for the given instances.
     """
-    language = language if language in get_supported_languages() else get_fallback_language()
+    language = language if is_supported_language(language) else get_fallback_language()
     for instance in instances:
         instance.activate_language(language)
 
@@ -111,7 +221,7 @@ def chunks(l, n):
     """
     Yields successive n-sized chunks from l.
     """
-    for i in xrange(0, len(l), n):
+    for i in six.moves.range(0, len(l), n):
         yield l[i:i + n]
 
 
@@ -211,9 +321,8 @@ def get_translation_lookup(identifier, field, value):
 
     name_parts = parts[0].split('_')
     if len(name_parts) > 1:
-        supported_languages = get_supported_languages()
         last_part = name_parts[-1]
-        if last_part in supported_languages:
+        if is_supported_language(last_part):
             # title_with_underscore_fr?
             field_name = '_'.join(name_parts[:-1])
             language = last_part
@@ -242,6 +351,18 @@ def get_field_name_from_lookup(lookup):
     return lookup.split('__')[0]
 
 
+def get_instance_model(instance):
+    """
+    Returns the model of the given instance: the model deferred rows (of
+    ``only()`` / ``defer()`` querysets) are built from, instead of their
+    deferred class.
+    """
+    model = instance._meta.model
+    if getattr(model, '_deferred', False):
+        return model._meta.proxy_for_model
+    return model
+
+
 def get_grouped_translations(instances, **kwargs):
     """
     Takes instances and returns grouped translations ready to
@@ -258,47 +379,212 @@ def get_grouped_translations(instances, **kwargs):
     if isinstance(instances, QuerySet):
         model = instances.model
     else:
-        model = instances[0]._meta.model
+        model = get_instance_model(instances[0])
 
     instances_ids = []
 
     for instance in instances:
         instances_ids.append(instance.pk)
 
-        if instance._meta.model != model:
+        if get_instance_model(instance) != model:
             raise Exception("You cannot use different model instances, only one authorized.")
 
-    from .models import Translation
+    from .cache import is_caching_translations
     from .mixins import ModelMixin
 
-    decider = model._meta.linguist.get('decider', Translation)
-    identifier = model._meta.linguist.get('identifier', None)
+    # Deferred (only() / defer()) model classes have no linguist Meta
+    decider = model._linguist.decider
+    identifier = model._linguist.identifier
     chunks_length = kwargs.get('chunks_length', None)
+    chunks_workers = kwargs.get('chunks_workers', settings.PREFETCH_WORKERS)
+    using = kwargs.get('using', None)
     populate_missing = kwargs.get('populate_missing', True)
 
     if identifier is None:
         raise Exception('You must define Linguist "identifier" meta option')
 
-    lookup = dict(identifier=identifier)
+    lookup = dict(identifier=identifier, **get_prefetch_lookup(**kwargs))
+
+    if is_caching_translations():
+        translations = get_cached_grouped_translations(decider, identifier, instances_ids, lookup,
+                                                       chunks_length=chunks_length,
+                                                       workers=chunks_workers, using=using)
+    elif chunks_length is not None:
+        translations = get_chunked_translations(decider, instances_ids, lookup,
+                                                chunks_length, workers=chunks_workers, using=using)
+    else:
+        lookup['object_id__in'] = instances_ids
+        translations = decider.objects.using(using).filter(**lookup)
+
+    for translation in translations:
+        grouped_translations[translation.object_id].append(translation)
+
+    return grouped_translations
+
+
+def get_chunked_translations(decider, object_ids, lookup, chunks_length, workers=None, using=None):
+    """
+    Returns translations of the given objects, fetched by chunks of
+    ``chunks_length`` IDs. With more than one worker, chunks are fetched
+    concurrently, each thread on its own database connection (on the
+    ``using`` database, if given). Chunks are fetched one after another
+    within a transaction, whose uncommitted rows other connections can't
+    see.
+    """
+    def fetch(ids):
+        return list(decider.objects.using(using).filter(object_id__in=ids, **lookup))
+
+    alias = decider.objects.db_manager(using).db
+
+    def fetch_in_thread(ids):
+        try:
+            return fetch(ids)
+        finally:
+            connections[alias].close()
+
+    ids_chunks = list(chunks(object_ids, chunks_length))
+
+    if not workers or workers < 2 or len(ids_chunks) < 2 or connections[alias].in_atomic_block:
+        return itertools.chain.from_iterable(fetch(ids) for ids in ids_chunks)
+
+    pool = ThreadPool(min(workers, len(ids_chunks)))
+    try:
+        return itertools.chain.from_iterable(pool.map(fetch_in_thread, ids_chunks))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def get_prefetch_lookup(**kwargs):
+    """
+    Returns translations lookup for ``field_names`` and ``languages``
+    prefetch options (see ``get_active_prefetch_languages()``).
+    """
+    lookup = {}
     for kwarg in ('field_names', 'languages'):
         value = kwargs.get(kwarg, None)
         if value is not None:
             if not isinstance(value, (list, tuple)):
                 value = [value]
             lookup['%s__in' % kwarg[:-1]] = value
+    if 'language__in' not in lookup:
+        languages = get_active_prefetch_languages(**kwargs)
+        if languages is not None:
+            lookup['language__in'] = languages
+    return lookup
+
+
+def get_populated_scope(**kwargs):
+    """
+    Returns ``populate_missing_translations()`` keyword arguments matching
+    the given prefetch options: translations out of the prefetched languages
+    (see ``get_active_prefetch_languages()``) and, with the ``deferred``
+    option, out of the prefetched ``field_names``, are loaded on access
+    instead of being flagged as missing. The ``deferred`` option also
+    restricts the scope to the given ``languages``.
+    """
+    scope = {'languages': get_active_prefetch_languages(**kwargs)}
+    if kwargs.get('deferred', False):
+        scope['field_names'] = kwargs.get('field_names', None)
+        if kwargs.get('languages', None) is not None:
+            scope['languages'] = kwargs['languages']
+    return scope
+
+
+def get_active_prefetch_languages(**kwargs):
+    """
+    Returns the active language fallback chain (see
+    ``get_fallback_languages()``) if prefetch is restricted to it (``active_languages`` prefetch option, defaults to
+    ``settings.PREFETCH_ACTIVE_LANGUAGES``) and no ``languages`` are given.
+    Otherwise returns None.
+    """
+    if kwargs.get('languages', None) is not None:
+        return None
 
-    if chunks_length is not None:
-        translations_qs = []
-        for ids in utils.chunks(instances_ids, chunks_length):
-            ids_lookup = copy.copy(lookup)
-            ids_lookup['object_id__in'] = ids
-            translations_qs.append(decider.objects.filter(**ids_lookup))
-        translations = itertools.chain.from_iterable(translations_qs)
+    if not kwargs.get('active_languages', settings.PREFETCH_ACTIVE_LANGUAGES):
+        return None
+
+    return get_fallback_languages()
+
+
+def get_identifiers_grouped_translations(decider, object_ids_by_identifier, **kwargs):
+    """
+    Takes a ``{identifier: object IDs}`` dictionary of objects sharing the
+    given decider and returns their translations grouped by
+    ``(identifier, object_id)``, in a single query.
+
+    Takes ``field_names`` and ``languages`` optional keyword arguments.
+    """
+    from .cache import is_caching_translations
+
+    grouped_translations = collections.defaultdict(list)
+
+    if not object_ids_by_identifier:
+        return grouped_translations
+
+    lookup = get_prefetch_lookup(**kwargs)
+
+    if is_caching_translations():
+        translations = itertools.chain.from_iterable(
+            get_cached_grouped_translations(decider, identifier, list(object_ids), lookup)
+            for identifier, object_ids in six.iteritems(object_ids_by_identifier))
     else:
-        lookup['object_id__in'] = instances_ids
-        translations = decider.objects.filter(**lookup)
+        lookups = [Q(identifier=identifier, object_id__in=list(object_ids))
+                   for identifier, object_ids in six.iteritems(object_ids_by_identifier)]
+        translations = decider.objects.filter(functools.reduce(operator.or_, lookups), **lookup)
 
     for translation in translations:
-        grouped_translations[translation.object_id].append(translation)
+        grouped_translations[(translation.identifier, translation.object_id)].append(translation)
 
     return grouped_translations
+
+
+def get_cached_grouped_translations(decider, identifier, object_ids, lookup,
+                                    chunks_length=None, workers=None, using=None):
+    """
+    Returns translations of the given objects from the identity map, then
+    the shared cache, loading (and caching) the remaining objects from
+    database (see ``get_chunked_translations()`` for ``chunks_length``,
+    ``workers`` and ``using``). Objects translations are cached as a whole:
+    ``field_name__in`` and ``language__in`` lookups are applied afterwards.
+    """
+    from .cache import (
+        get_identity_map_translations,
+        get_shared_translations,
+        set_identity_map_translations,
+        set_shared_translations,
+    )
+
+    grouped_translations = get_identity_map_translations(decider, identifier, object_ids)
+
+    missing_ids = [object_id for object_id in object_ids if object_id not in grouped_translations]
+
+    if missing_ids:
+        found = get_shared_translations(decider, identifier, missing_ids)
+
+        missing_ids = [object_id for object_id in missing_ids if object_id not in found]
+
+        if missing_ids:
+            loaded = dict((object_id, []) for object_id in missing_ids)
+            if chunks_length is not None:
+                translations = get_chunked_translations(decider, missing_ids, {'identifier': identifier},
+                                                        chunks_length, workers=workers, using=using)
+            else:
+                translations = decider.objects.using(using).filter(identifier=identifier,
+                                                                   object_id__in=missing_ids)
+            for translation in translations:
+                loaded[translation.object_id].append(translation)
+            set_shared_translations(decider, identifier, loaded)
+            found.update(loaded)
+
+        set_identity_map_translations(decider, identifier, found)
+        grouped_translations.update(found)
+
+    field_names = lookup.get('field_name__in', None)
+    languages = lookup.get('language__in', None)
+
+    return [translation
+            for translations in grouped_translations.values()
+            for translation in translations
+            if field_names is None or translation.field_name in field_names
+            if languages is None or translation.language in languages]